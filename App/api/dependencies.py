@@ -2,6 +2,12 @@
 FastAPI dependencies for authentication.
 """
 
+import asyncio
+import hashlib
+import time
+from threading import Lock
+
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from typing import Dict, Optional
@@ -9,10 +15,68 @@ from typing import Dict, Optional
 from App.core.config import settings
 from App.core.security import decode_token
 from App.core.exceptions import AuthenticationError
-from App.services.auth_service import AuthService
+from App.services.auth_service import get_auth_service
 
 security = HTTPBearer(auto_error=False)
-auth_service = AuthService()
+auth_service = get_auth_service()
+
+# Cache decoded JWT payloads so repeat requests with the same token skip the
+# JSON parse + HMAC verification. Keyed by a hash of the token (not the raw
+# token) and kept short-lived; expiry is still checked on every hit.
+_decode_cache = TTLCache(maxsize=10_000, ttl=60)
+_decode_cache_lock = Lock()
+
+# Token subjects that never map to a stored user record.
+_service_principal_subs = frozenset(settings.service_principal_subs)
+
+
+# In-flight decodes keyed by token hash: concurrent misses for the same token
+# await one future instead of all running the HMAC verification.
+_inflight_decodes: Dict[bytes, "asyncio.Future"] = {}
+
+
+async def _decode_token_cached(token: str) -> Dict[str, str]:
+    """
+    Decode a JWT, using a short TTL cache to skip repeat verification.
+
+    The token's `exp` claim is re-checked on every cache hit so a cached
+    payload can never outlive the token itself. Cache misses are
+    double-checked against an in-flight table so a burst of requests with
+    the same new token runs the decode exactly once.
+    """
+    # blake2b is noticeably faster than sha256 for short inputs, and a
+    # 16-byte digest is plenty of key space for a process-local cache.
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    with _decode_cache_lock:
+        payload = _decode_cache.get(key)
+
+    if payload is None:
+        inflight = _inflight_decodes.get(key)
+        if inflight is not None:
+            payload = await inflight
+        else:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            _inflight_decodes[key] = future
+            try:
+                payload = await loop.run_in_executor(None, decode_token, token)
+            except Exception as e:
+                future.set_exception(e)
+                future.exception()  # mark retrieved if nobody else awaits
+                raise
+            finally:
+                _inflight_decodes.pop(key, None)
+            future.set_result(payload)
+
+            with _decode_cache_lock:
+                _decode_cache[key] = payload
+            return payload
+
+    exp = payload.get("exp")
+    if exp is not None and exp <= time.time():
+        raise AuthenticationError("Token has expired")
+    return payload
 
 
 async def get_current_user(
@@ -28,6 +92,12 @@ async def get_current_user(
             user_id = current_user["user_id"]
             email = current_user["email"]
     """
+    # Request-scoped memoization: if another dependency in this request
+    # already resolved the user, reuse it instead of re-hitting the DB.
+    cached_user = getattr(request.state, "current_user", None)
+    if cached_user is not None:
+        return cached_user
+
     try:
         token: Optional[str] = None
         token = request.cookies.get(settings.access_cookie_name)
@@ -39,23 +109,34 @@ async def get_current_user(
         if not token:
             raise AuthenticationError("Missing authentication token")
         
-        payload = decode_token(token)
-        
+        payload = await _decode_token_cached(token)
+
         user_id = payload.get("sub")
         if not user_id:
             raise AuthenticationError("Invalid token payload")
-        
-        # Get user from database
-        user = auth_service.get_user_by_id(user_id)
+
+        # Service/proxy principals (health checkers, workers) have no user
+        # row; return a synthetic user and skip the DynamoDB lookup.
+        if user_id in _service_principal_subs:
+            return {
+                "user_id": user_id,
+                "email": payload.get("email", ""),
+                "full_name": "service"
+            }
+
+        # Get user from database (coalesced with other in-flight lookups)
+        user = await auth_service.get_user_by_id_batched(user_id)
         if not user:
             raise AuthenticationError("User not found")
         
-        return {
+        current_user = {
             "user_id": user["user_id"],
             "email": user["email"],
             "full_name": user.get("full_name")
         }
-        
+        request.state.current_user = current_user
+        return current_user
+
     except AuthenticationError as e:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
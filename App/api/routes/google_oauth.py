@@ -2,19 +2,22 @@
 Google OAuth (OIDC) routes: login + callback (cookie-based auth).
 """
 
+import asyncio
 import base64
+import functools
 import hashlib
 import secrets
 from urllib.parse import urlencode
 
-import httpx
+import cachecontrol
+import requests as sync_requests
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse, RedirectResponse
+from fastapi.responses import ORJSONResponse, RedirectResponse
 from google.oauth2 import id_token
 from google.auth.transport import requests as google_requests
 
 from App.core.config import settings
-from App.services.auth_service import AuthService
+from App.services.auth_service import get_auth_service
 
 router = APIRouter(prefix="/auth/google", tags=["auth"])
 
@@ -22,14 +25,40 @@ router = APIRouter(prefix="/auth/google", tags=["auth"])
 AUTH_URI = "https://accounts.google.com/o/oauth2/v2/auth"
 TOKEN_URI = "https://oauth2.googleapis.com/token"
 
-auth_service = AuthService()
+auth_service = get_auth_service()
+
+# Shared transport for Google ID-token verification. Reusing one session keeps
+# the TLS connection to Google's cert endpoint alive across callbacks, and the
+# CacheControl wrapper caches the signing certs for the max-age Google sends,
+# so most verifications skip the HTTPS cert fetch entirely.
+_google_transport = google_requests.Request(
+    session=cachecontrol.CacheControl(sync_requests.Session())
+)
+
+
+# Translate standard base64 output to the URL-safe alphabet in one C-level
+# pass instead of the extra copies urlsafe_b64encode makes.
+_URLSAFE_TRANS = bytes.maketrans(b"+/", b"-_")
+_SHA256 = hashlib.sha256
+
+# The static portion of the authorization URL never changes; encode it once.
+# "offline" gives refresh tokens (useful later); prompt consent forces a
+# refresh token on first login.
+_STATIC_AUTH_QS = urlencode({
+    "client_id": settings.google_client_id,
+    "redirect_uri": settings.google_redirect_uri,
+    "response_type": "code",
+    "scope": "openid email profile",
+    "access_type": "offline",
+    "prompt": "consent",
+})
 
 
 def _b64url(data: bytes) -> str:
     """
     Base64-url encode without padding. Required by PKCE.
     """
-    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("utf-8")
+    return base64.b64encode(data).translate(_URLSAFE_TRANS).rstrip(b"=").decode("ascii")
 
 
 def _pkce_pair() -> tuple[str, str]:
@@ -39,7 +68,7 @@ def _pkce_pair() -> tuple[str, str]:
     - challenge: SHA256(verifier) sent to Google
     """
     verifier = _b64url(secrets.token_bytes(32))
-    challenge = _b64url(hashlib.sha256(verifier.encode("utf-8")).digest())
+    challenge = _b64url(_SHA256(verifier.encode("utf-8")).digest())
     return verifier, challenge
 
 
@@ -58,22 +87,16 @@ def google_login():
     state = secrets.token_urlsafe(32)
     verifier, challenge = _pkce_pair()
 
-    params = {
-        "client_id": settings.google_client_id,
-        "redirect_uri": settings.google_redirect_uri,
-        "response_type": "code",
-        "scope": "openid email profile",
-        "state": state,
-        "code_challenge": challenge,
-        "code_challenge_method": "S256",
-        # "offline" gives refresh tokens (useful later); prompt consent forces refresh token on first time
-        "access_type": "offline",
-        "prompt": "consent",
-    }
-
-    auth_url = f"{AUTH_URI}?{urlencode(params)}"
+    # state and challenge are already URL-safe, so only the static params
+    # need urlencode — and those are precomputed at import.
+    auth_url = (
+        f"{AUTH_URI}?{_STATIC_AUTH_QS}"
+        f"&state={state}&code_challenge={challenge}&code_challenge_method=S256"
+    )
 
-    resp = JSONResponse({"auth_url": auth_url})
+    # Explicitly ORJSONResponse: the app-level default_response_class only
+    # applies to returned plain values, not responses constructed by hand.
+    resp = ORJSONResponse({"auth_url": auth_url})
 
     # Temporary cookies (10 min) used to validate callback
     resp.set_cookie(
@@ -135,8 +158,9 @@ async def google_callback(request: Request, code: str | None = None, state: str
         "code_verifier": verifier,
     }
 
-    async with httpx.AsyncClient(timeout=15) as client:
-        token_res = await client.post(TOKEN_URI, data=data)
+    # Reuse the app-scoped client so the TLS connection to Google is pooled
+    # instead of re-handshaking on every callback.
+    token_res = await request.app.state.http_client.post(TOKEN_URI, data=data)
 
     if token_res.status_code != 200:
         raise HTTPException(status_code=400, detail=f"Token exchange failed: {token_res.text}")
@@ -146,12 +170,18 @@ async def google_callback(request: Request, code: str | None = None, state: str
     if not raw_id_token:
         raise HTTPException(status_code=400, detail="No id_token returned by Google")
 
-    # Verify Google ID token (signature + aud + exp + iss)
+    # Verify Google ID token (signature + aud + exp + iss).
+    # verify_oauth2_token is blocking (cert fetch + RSA verify), so run it in
+    # a worker thread instead of stalling the event loop.
     try:
-        claims = id_token.verify_oauth2_token(
-            raw_id_token,
-            google_requests.Request(),
-            settings.google_client_id,
+        claims = await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                id_token.verify_oauth2_token,
+                raw_id_token,
+                _google_transport,
+                settings.google_client_id,
+            ),
         )
     except Exception:
         raise HTTPException(status_code=401, detail="Invalid Google id_token")
@@ -164,8 +194,11 @@ async def google_callback(request: Request, code: str | None = None, state: str
     if not google_sub or not email:
         raise HTTPException(status_code=400, detail="Google token missing sub/email")
 
-    # NOTE: We will implement this method next (AuthService change)
-    result = auth_service.login_or_register_google_user(
+    # login_or_register_google_user is synchronous boto3 work (up to four
+    # DynamoDB round-trips), so run it in a worker thread like the token
+    # verification above instead of stalling the event loop.
+    result = await asyncio.to_thread(
+        auth_service.login_or_register_google_user,
         google_sub=google_sub,
         email=email,
         full_name=full_name,
@@ -1,17 +1,35 @@
 """
 FastAPI application with proper exception handling.
 """
-import boto3
+import asyncio
+import functools
+import hashlib
+import httpx
+import orjson
 import os
+import time
+from cachetools import TTLCache
+from collections import OrderedDict
 from dotenv import load_dotenv
-from datetime import datetime
-from fastapi import FastAPI, Request, Depends, Response
-from fastapi.responses import JSONResponse
+from threading import Lock
+from datetime import datetime, timezone
+from fastapi import BackgroundTasks, FastAPI, Request, Depends, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
+import fastapi.dependencies.utils
+
+# FastAPI runs inspect.signature / type-hint resolution over the same
+# dependency callables (get_current_user, security, ...) every time it builds
+# a dependant; memoize the signature lookup so repeated resolutions are a dict
+# hit. Must happen before any router/endpoint is declared, hence before the
+# App.api imports below.
+fastapi.dependencies.utils.get_typed_signature = functools.lru_cache(maxsize=4096)(
+    fastapi.dependencies.utils.get_typed_signature
+)
 
 from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from langchain_core.messages import HumanMessage
 
 # Import your custom exceptions and utilities
@@ -21,22 +39,23 @@ from .core.exceptions import (
     ThreadNotFoundError,
     DeserializationError,
     DatabaseError,
-    NoAccessToThread
+    NoAccessToThread,
+    ChatHistoryNotFoundError
 )
 from .utils.validators import ThreadIDValidator
 from .utils.serializers import CheckpointSerializer, extract_messages
-from ChatBot.LangGraph_workflow import app as langgraph_app
+from .utils.batching import BatchedGetItem
 from App.api.routes.google_oauth import router as google_oauth_router
+from App.core.aws import dynamodb, table
 from App.core.config import settings
-from App.core.exceptions import ChatHistoryBaseException, InvalidThreadIDError, ThreadNotFoundError, DeserializationError, DatabaseError, ChatHistoryNotFoundError
 from App.models.requests import UserRegister, UserLogin, ChatRequest
 from App.models.responses import Token, UserResponse, ChatResponse
-from App.services.auth_service import AuthService
+from App.services.auth_service import get_auth_service
 from App.api.dependencies import get_current_user
 
 load_dotenv()
 
-app = FastAPI(title=settings.app_name, version=settings.app_version)
+app = FastAPI(title=settings.app_name, version=settings.app_version, default_response_class=ORJSONResponse)
 app.include_router(google_oauth_router)
 
 app.add_middleware(
@@ -47,13 +66,81 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Your existing DynamoDB setup
-dynamodb = boto3.resource('dynamodb', region_name=os.getenv("AWS_REGION", "us-east-1"))
+# Your existing DynamoDB setup (shared resource with a sized connection pool)
 check_pointer_table = os.getenv("CHECKPOINTER_TABLE", "langgraph-checkpoints")
 user_personal_history_table = os.getenv("USER_PERSONAL_HISTORY", "user-personal-history")
 
+# Bind Table objects once at import; building them per request re-walks the
+# boto3 service model for no benefit.
+checkpointer_table_resource = table(check_pointer_table)
+user_history_table_resource = table(user_personal_history_table)
+
+# Coalesces concurrent point reads into BatchGetItem calls
+batched_get_item = BatchedGetItem(dynamodb)
+
+# Per-user set of owned thread_ids so repeat history loads can skip the
+# ownership get_item for a few seconds. Invalidated on history writes.
+_ownership_cache = TTLCache(maxsize=10_000, ttl=30)
+_ownership_lock = Lock()
+
+
+def _invalidate_ownership_cache(user_id):
+    with _ownership_lock:
+        _ownership_cache.pop(user_id, None)
+
+
+async def _run_db(func, /, **kwargs):
+    """
+    Run a blocking boto3 call in a worker thread.
+
+    boto3 has no async API; calling it directly inside an async endpoint
+    stalls the event loop for the full DynamoDB round-trip.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, **kwargs))
+
+
+auth_service = get_auth_service()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_langgraph():
+    """
+    Import and return the compiled LangGraph workflow on first use.
+
+    Importing ChatBot.LangGraph_workflow builds the graph and its LLM /
+    Pinecone clients; keeping it out of the module import path makes worker
+    cold starts (and /health on fresh workers) much cheaper.
+    """
+    from ChatBot.LangGraph_workflow import app as langgraph_app
+    return langgraph_app
+
+
+@app.on_event("startup")
+async def create_http_client():
+    """Create one shared HTTP client so outbound calls reuse connections."""
+    app.state.http_client = httpx.AsyncClient(
+        timeout=15,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    )
+
+
+@app.on_event("startup")
+async def warm_langgraph():
+    """
+    Warm the LangGraph workflow in the background at startup.
+
+    The graph (and its LLM / Pinecone / checkpointer wiring) is built once
+    and cached by _get_langgraph; doing that build off the startup path means
+    the worker accepts traffic immediately and the first chat request finds
+    the graph already compiled instead of paying the import.
+    """
+    asyncio.get_running_loop().run_in_executor(None, _get_langgraph)
+
 
-auth_service = AuthService()
+@app.on_event("shutdown")
+async def close_http_client():
+    await app.state.http_client.aclose()
 
 # ============================================================================
 # Global Exception Handlers
@@ -62,7 +149,7 @@ auth_service = AuthService()
 @app.exception_handler(ChatHistoryBaseException)
 async def chat_history_exception_handler(request: Request, exc: ChatHistoryBaseException):
     """Handle all custom exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content=exc.to_dict()
     )
@@ -71,7 +158,7 @@ async def chat_history_exception_handler(request: Request, exc: ChatHistoryBaseE
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle unexpected exceptions."""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "InternalServerError",
@@ -92,7 +179,7 @@ async def general_exception_handler(request: Request, exc: Exception):
 @app.post("/auth/register")
 async def register(user_data: UserRegister, response: Response):
     """Register a new user and set session cookie."""
-    result = auth_service.register_user(
+    result = await auth_service.register_user(
         email=user_data.email,
         password=user_data.password,
         full_name=user_data.full_name
@@ -118,7 +205,7 @@ async def register(user_data: UserRegister, response: Response):
 @app.post("/auth/login")
 async def login(login_data: UserLogin, response: Response):
     """Login user and set session cookie."""
-    result = auth_service.login_user(
+    result = await auth_service.login_user(
         email=login_data.email,
         password=login_data.password
     )
@@ -167,7 +254,7 @@ async def logout(response: Response):
 # GET Chat History
 # ---------------------------------------------------------------------------------------------------------------------
 @app.get("/chats/specific/{thread_id}")
-async def get_chat_history(thread_id: str, max_messages: int = 100, current_user: dict = Depends(get_current_user)):
+async def get_chat_history(request: Request, thread_id: str, max_messages: int = 100, current_user: dict = Depends(get_current_user)):
     """
     Retrieve chat history for a thread.
     
@@ -190,56 +277,62 @@ async def get_chat_history(thread_id: str, max_messages: int = 100, current_user
     
     try:
         current_user_id = current_user["email"]
-        
-        #first check if thread_id is in checpointer table if not then it is new and dont care about ownership else get along rest of the code
-        checkpointer_table = dynamodb.Table(check_pointer_table)  # or settings.checkpointer_table
-        response = checkpointer_table.query(
+
+        # The ownership read and the checkpointer query touch different
+        # tables and don't depend on each other's result, so start the
+        # checkpointer query immediately and resolve ownership alongside it
+        # rather than serializing the two round-trips. If ownership fails the
+        # in-flight query is wasted, but that's the rare path — the common
+        # (owned) case saves a full DynamoDB round-trip of latency.
+        # Only the checkpoint blob (and its id, for the ETag) is projected;
+        # skip the metadata/version attributes DynamoDB would otherwise return.
+        query_task = asyncio.create_task(_run_db(
+            checkpointer_table_resource.query,
             KeyConditionExpression=Key("PK").eq(thread_id),
             ScanIndexForward=False,
             Limit=1,
             ConsistentRead=True,
-        )
-
-        items = response.get("Items", [])
-
-        # If there is no checkpoint at all for this thread_id,
-        # treat it as "no history yet" (new or invalid thread).
-        if not items:
+            ProjectionExpression="#c, checkpoint_id",
+            ExpressionAttributeNames={"#c": "checkpoint"}
+        ))
+
+        # A cached ownership set avoids re-reading the history item on
+        # repeat loads (stale misses fall through to a fresh read).
+        with _ownership_lock:
+            owned_threads = _ownership_cache.get(current_user_id)
+
+        if owned_threads is None or thread_id not in owned_threads:
+            # Only the history list matters here, and an eventually
+            # consistent read (the get_item default) is fine — ownership
+            # changes propagate well inside the cache TTL.
+            history_resp = await _run_db(
+                user_history_table_resource.get_item,
+                Key={"user_id": current_user_id},
+                ProjectionExpression="personal_history",
+            )
+            history_item = history_resp.get("Item")
+
+            owned_threads = {
+                h.get("thread_id") for h in history_item.get("personal_history", [])
+            } if history_item else set()
+            with _ownership_lock:
+                _ownership_cache[current_user_id] = owned_threads
+
+        if thread_id not in owned_threads:
+            # A thread the user just opened has no history entry yet (the
+            # background append runs after the first message); report it as
+            # empty rather than denying access to their own new thread.
+            # Someone else's thread looks identical, which also avoids
+            # leaking whether a given thread_id exists.
+            query_task.cancel()
             return {
                 "thread_id": thread_id,
                 "message_count": 0,
                 "messages": [],
             }
 
-        # check for thread_id belongs to current user in personal history
-        history_table = dynamodb.Table(user_personal_history_table)
-        history_resp = history_table.get_item(Key={"user_id": current_user_id})
-        history_item = history_resp.get("Item")
-
-        # If user has no history at all
-        if not history_item:
-            # You can choose 404 or 403. 403 is more explicit:
-            raise NoAccessToThread("You do not have access to this thread")
-
-        personal_history = history_item.get("personal_history", [])
-
-        # Check if this thread_id is in their personal_history list
-        owns_thread = any(
-            h.get("thread_id") == thread_id for h in personal_history
-        )
+        response = await query_task
 
-        if not owns_thread:
-            raise NoAccessToThread("You do not have access to this thread")
-
-        # Query DynamoDB
-        table = dynamodb.Table(check_pointer_table)
-        response = table.query(
-            KeyConditionExpression=Key("PK").eq(thread_id),
-            ScanIndexForward=False,
-            Limit=1,
-            ConsistentRead=True
-        )
-        
         items = response.get("Items", [])
         
         # Check if thread exists
@@ -256,23 +349,43 @@ async def get_chat_history(thread_id: str, max_messages: int = 100, current_user
         
         if not checkpoint_blob:
             raise DeserializationError("Checkpoint blob is missing")
-        
+
+        # Cheap change detection: the checkpoint id names this exact
+        # checkpoint version, so a client that already has it can skip the
+        # deserialize and the transfer entirely. The fallback hash goes
+        # through _to_bytes because the blob may be a base64 str or boto3
+        # Binary, not just bytes — bytes() would raise on those.
+        etag = latest_checkpoint.get("checkpoint_id") or hashlib.md5(
+            CheckpointSerializer._to_bytes(checkpoint_blob)
+        ).hexdigest()
+        etag = f'"{etag}"'
+        if request.headers.get("If-None-Match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+
         # Deserialize checkpoint
         checkpoint_data = CheckpointSerializer.deserialize(checkpoint_blob)
         
         # Extract messages
         messages = extract_messages(checkpoint_data)
-        
+
         # Limit messages
         # if len(messages) > max_messages:
         #     messages = messages[:max_messages]
-        
-        return {
-            "thread_id": thread_id,
-            "message_count": len(messages),
-            "messages": messages
-        }
-        
+
+        # Stream the body message-by-message instead of building one big
+        # JSON string; keeps peak memory flat for long threads and starts
+        # the response sooner.
+        def _stream_history():
+            yield b'{"thread_id":' + orjson.dumps(thread_id) + \
+                b',"message_count":' + str(len(messages)).encode() + b',"messages":['
+            for i, message in enumerate(messages):
+                if i:
+                    yield b","
+                yield orjson.dumps(message)
+            yield b"]}"
+
+        return StreamingResponse(_stream_history(), media_type="application/json", headers={"ETag": etag})
+
     except ChatHistoryBaseException:
         # Re-raise our custom exceptions (handled by exception handler)
         raise
@@ -293,6 +406,8 @@ async def get_chat_history(thread_id: str, max_messages: int = 100, current_user
 # GET Personal Chat History(Stiill need to implement fully)
 # ---------------------------------------------------------------------------------------------------------------------
 class PersonalChatHistoryResponse(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
     user_id: str
     personal_history: list
 
@@ -311,10 +426,8 @@ async def get_personal_chat_history(current_user: dict = Depends(get_current_use
     # In a real application, you would integrate with your chat history storage here.
     try:
         user_id = current_user["email"]
-        table = dynamodb.Table(user_personal_history_table)
-        response = table.get_item(Key={"user_id": user_id})
-        item = response.get("Item", {})
-        personal_history = item.get("personal_history", [])
+        item = await batched_get_item.get(user_personal_history_table, {"user_id": user_id}) or {}
+        personal_history = _compact_personal_history(item.get("personal_history", []))
 
         return PersonalChatHistoryResponse(
             user_id=user_id,
@@ -332,16 +445,8 @@ async def get_personal_chat_history(current_user: dict = Depends(get_current_use
 # ---------------------------------------------------------------------------------------------------------------------
 # Chat with the ChatBot Model
 #----------------------------------------------------------------------------------------------------------------------
-class ChatRequest(BaseModel):
-    user_message: str
-
-class ChatResponse(BaseModel):
-    thread_id: str
-    user_message: str
-    model_response: str
-
 @app.post("/chats/{thread_id}", response_model=ChatResponse)
-async def chat_with_model(thread_id: str, item: ChatRequest, current_user: dict = Depends(get_current_user)):
+async def chat_with_model(thread_id: str, item: ChatRequest, background_tasks: BackgroundTasks, current_user: dict = Depends(get_current_user)):
     """
     Endpoint to send a message to the chat model and receive a response.
     
@@ -357,12 +462,16 @@ async def chat_with_model(thread_id: str, item: ChatRequest, current_user: dict
         user= current_user["email"]
         thread_id = ThreadIDValidator.validate(thread_id)
 
-        #check and upodate personal history
-        update_personal_history(thread_id, user, user_message)
+        #check and update personal history after the response is sent;
+        #the DynamoDB write doesn't need to block the model invocation
+        background_tasks.add_task(update_personal_history, thread_id, user, user_message)
 
         #setting up LangGraph workflow input
+        #ainvoke yields the event loop between nodes and runs any sync node
+        #in LangGraph's own executor, so the loop stays free for the whole
+        #LLM + Pinecone + DynamoDB round-trip
         config = {"configurable": {"thread_id": thread_id}}
-        state = langgraph_app.invoke(
+        state = await _get_langgraph().ainvoke(
             {"messages": [HumanMessage(content=user_message)]},
             config=config
         )
@@ -374,12 +483,13 @@ async def chat_with_model(thread_id: str, item: ChatRequest, current_user: dict
                 content = last_message.content
 
                 if isinstance(content, list):
-                    # If content is a list (structured), extract text parts
-                    text_parts = []
-                    for item in content:
-                        if isinstance(item, dict) and item.get("type") == "text":
-                            text_parts.append(item.get("text", ""))
-                    ai_response = " ".join(text_parts) if text_parts else ""
+                    # If content is a list (structured), join the text parts
+                    # in one pass — no intermediate list, no empty-join branch
+                    ai_response = " ".join(
+                        part["text"]
+                        for part in content
+                        if isinstance(part, dict) and part.get("type") == "text" and part.get("text")
+                    )
                 elif isinstance(content, str):
                     ai_response = content
                 else:
@@ -403,57 +513,121 @@ async def chat_with_model(thread_id: str, item: ChatRequest, current_user: dict
     except Exception as e:
         raise DatabaseError(f"Unexpected error: {str(e)}", e)
 
+@app.post("/chats/{thread_id}/stream")
+async def chat_with_model_stream(thread_id: str, item: ChatRequest, background_tasks: BackgroundTasks, current_user: dict = Depends(get_current_user)):
+    """
+    Streaming variant of /chats/{thread_id}: sends model tokens over SSE as
+    they are generated instead of buffering the full reply.
+
+    Each token arrives as `data: {"delta": "..."}`; the stream ends with
+    `data: [DONE]`. The buffered endpoint stays for clients that want one
+    JSON body — this one exists so the first token reaches the browser in
+    ~100ms rather than after the whole generation.
+    """
+    try:
+        user_message = item.user_message
+        user = current_user["email"]
+        thread_id = ThreadIDValidator.validate(thread_id)
+
+        #same bookkeeping as the buffered endpoint: record the thread after
+        #the response, off the request path
+        background_tasks.add_task(update_personal_history, thread_id, user, user_message)
+
+        config = {"configurable": {"thread_id": thread_id}}
+        langgraph_app = _get_langgraph()
+    except ChatHistoryBaseException:
+        raise
+    except Exception as e:
+        raise DatabaseError(f"Unexpected error: {str(e)}", e)
+
+    async def _stream():
+        # Once streaming starts the status line is already sent, so the
+        # global exception handlers can't help; report failures as an SSE
+        # error event instead of silently truncating the stream.
+        try:
+            async for event in langgraph_app.astream_events(
+                {"messages": [HumanMessage(content=user_message)]},
+                config=config,
+                version="v2",
+            ):
+                if event["event"] != "on_chat_model_stream":
+                    continue
+                content = event["data"]["chunk"].content
+                if isinstance(content, list):
+                    # Structured content: keep only the text parts
+                    content = "".join(
+                        part.get("text", "")
+                        for part in content
+                        if isinstance(part, dict) and part.get("type") == "text"
+                    )
+                if content:
+                    yield b"data: " + orjson.dumps({"delta": content}) + b"\n\n"
+            yield b"data: [DONE]\n\n"
+        except Exception as e:
+            yield b"event: error\ndata: " + orjson.dumps({"error": type(e).__name__}) + b"\n\n"
+
+    return StreamingResponse(
+        _stream(),
+        media_type="text/event-stream",
+        # no-cache plus X-Accel-Buffering stop proxies from holding tokens
+        # back to coalesce them — the whole point is sending each one now
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 def update_personal_history(thread_id, user, user_message):
+    """
+    Record this thread in the user's history with a single atomic UpdateItem.
+
+    Always appends; list_append + if_not_exists also creates the item for new
+    users, so the previous get_item + update_item/put_item pair collapses into
+    one round-trip with no read-modify-write race. Duplicate thread entries
+    and the 20-thread cap are compacted lazily at read time by
+    _compact_personal_history; the stored list is only rewritten once it
+    drifts well past the cap, so the common chat turn stays at one write.
+    """
     try:
-        table = dynamodb.Table(user_personal_history_table)
-        response = table.get_item(Key={"user_id": user})
-        item = response.get("Item", {})
-
-        if item:
-            personal_history = item.get("personal_history", [])
-
-            #check for thread_id in personal history to pop it and append to very end for latest
-            already_there = False
-            for i, history in enumerate(personal_history):
-                if history.get('thread_id') == thread_id:
-                    already_there = True
-                    personal_history.pop(i)
-                    history['updated_at'] = datetime.utcnow().isoformat()
-                    personal_history.append(history)
-                    break
-            
-            if not already_there:
-                personal_history.append({
-                    "thread_id": thread_id,
-                    "title": " ".join(user_message.split(" ")[:8]),
-                    "created_at":  datetime.utcnow().isoformat(),
-                    "updated_at": datetime.utcnow().isoformat()
-                })
-            
-            if len(personal_history) > 20:
-                personal_history = personal_history[-20:]
-            
-            #Updateing table with new personal history 
-            table.update_item(  
+        # Compute these once up front: split(" ", 8) bounds tokenization to
+        # the 8 words we keep, and every timestamp in this call should match.
+        now_iso = datetime.now(timezone.utc).isoformat()
+        title = " ".join(user_message.split(" ", 8)[:8])
+
+        entry = {
+            "thread_id": thread_id,
+            "title": title,
+            "created_at": now_iso,
+            "updated_at": now_iso
+        }
+
+        table = user_history_table_resource
+        response = table.update_item(
+            Key={"user_id": user},
+            UpdateExpression=(
+                "SET personal_history = list_append(if_not_exists(personal_history, :empty), :new), "
+                "updated_at = :now, created_at = if_not_exists(created_at, :now)"
+            ),
+            ExpressionAttributeValues={
+                ":new": [entry],
+                ":empty": [],
+                ":now": now_iso
+            },
+            ReturnValues="UPDATED_NEW"
+        )
+        _invalidate_ownership_cache(user)
+
+        # Lazy trim: the append-only list grows one entry per chat turn and is
+        # only deduped/capped at read time. Once it drifts well past the
+        # 20-thread cap, rewrite it compacted so the item doesn't grow
+        # unboundedly. Runs in the background task, so the extra write never
+        # sits on a request path.
+        stored = response.get("Attributes", {}).get("personal_history", [])
+        if len(stored) > 40:
+            table.update_item(
                 Key={"user_id": user},
-                UpdateExpression="SET personal_history = :ph",
-                ExpressionAttributeValues={":ph": personal_history}
-            )
-        else:
-            # Create new user entry
-            table.put_item(
-                Item={
-                    "user_id": user,
-                    "personal_history": [
-                        {
-                            "thread_id": thread_id,
-                            "title": " ".join(user_message.split(" ")[:8]),
-                            "created_at":  datetime.utcnow().isoformat(),
-                            "updated_at": datetime.utcnow().isoformat()
-                        }
-                    ],
-                    "created_at": datetime.utcnow().isoformat(),
-                    "updated_at": datetime.utcnow().isoformat()
+                UpdateExpression="SET personal_history = :compacted, updated_at = :now",
+                ExpressionAttributeValues={
+                    ":compacted": _compact_personal_history(stored),
+                    ":now": now_iso
                 }
             )
     except ClientError as e:
@@ -461,6 +635,31 @@ def update_personal_history(thread_id, user, user_message):
         raise DatabaseError(f"DynamoDB operation failed: {error_code}", e)
     except Exception as e:
         raise DatabaseError(f"Unexpected error: {str(e)}", e)
+
+
+def _compact_personal_history(personal_history):
+    """
+    Collapse duplicate thread entries and apply the 20-thread cap.
+
+    The write path appends unconditionally, so repeat threads show up more
+    than once until a read. Keep the newest entry per thread (move-to-end
+    ordering) while preserving the original title and created_at.
+    """
+    ordered = OrderedDict()
+    for history in personal_history:
+        previous = ordered.pop(history.get("thread_id"), None)
+        if previous is not None:
+            history = {
+                **history,
+                "title": previous.get("title", history.get("title")),
+                "created_at": previous.get("created_at", history.get("created_at"))
+            }
+        ordered[history.get("thread_id")] = history
+
+    compacted = list(ordered.values())
+    if len(compacted) > 20:
+        compacted = compacted[-20:]
+    return compacted
 #----------------------------------------------------   ----------------------------------- -------------
 
 # -----------------------------------------------------------------------------------------------------
@@ -479,8 +678,13 @@ async def delete_chat_thread(thread_id: str, current_user: dict = Depends(get_cu
     try:
         user_id = current_user["email"]
         thread_id = ThreadIDValidator.validate(thread_id)
-        table = dynamodb.Table(user_personal_history_table)
-        response = table.get_item(Key={"user_id": user_id})
+        table = user_history_table_resource
+        # The delete only rewrites personal_history; skip the rest of the item
+        response = await _run_db(
+            table.get_item,
+            Key={"user_id": user_id},
+            ProjectionExpression="personal_history",
+        )
         item = response.get("Item")
 
         if not item:
@@ -489,22 +693,23 @@ async def delete_chat_thread(thread_id: str, current_user: dict = Depends(get_cu
         personal_history = item.get("personal_history", [])
 
         # Check if this thread_id is in their personal_history list
-        owns_thread = any(
-            h.get("thread_id") == thread_id for h in personal_history
-        )
+        # (set membership, same shape as the ownership cache in get_chat_history)
+        owned = {h["thread_id"] for h in personal_history if "thread_id" in h}
 
-        if not owns_thread:
+        if thread_id not in owned:
             raise ChatHistoryNotFoundError("Thread not found or access denied")
 
         # Remove the thread from personal_history
         personal_history = [h for h in personal_history if h.get("thread_id") != thread_id]
 
         # Update the user's personal history
-        table.update_item(
+        await _run_db(
+            table.update_item,
             Key={"user_id": user_id},
             UpdateExpression="SET personal_history = :ph",
             ExpressionAttributeValues={":ph": personal_history}
         )
+        _invalidate_ownership_cache(user_id)
         return {"message": f"Thread {thread_id} deleted successfully"}
     except Exception as e:
         raise DatabaseError(f"Unexpected error: {str(e)}", e) 
@@ -518,15 +723,26 @@ async def delete_chat_thread(thread_id: str, current_user: dict = Depends(get_cu
 # -----------------------------------------------------------------------------------------------------
 # Health Check Endpoints
 # -----------------------------------------------------------------------------------------------------
+# Load balancers poll /health several times a second; DescribeTable is a
+# control-plane call with its own (low) AWS rate limit, so remember the last
+# success for a few seconds instead of re-probing on every hit.
+_HEALTH_CACHE = {"ok_until": 0.0}
+_HEALTH_CACHE_TTL = 10
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
+    if time.monotonic() < _HEALTH_CACHE["ok_until"]:
+        return {"status": "healthy", "build": "last thing added delete functionality"}
+
     try:
-        table = dynamodb.Table(check_pointer_table)
-        table.load()  # This will raise an error if the table doesn't exist or is inaccessible
+        await _run_db(checkpointer_table_resource.load)  # This will raise an error if the table doesn't exist or is inaccessible
+        _HEALTH_CACHE["ok_until"] = time.monotonic() + _HEALTH_CACHE_TTL
         return {"status": "healthy", "build": "last thing added delete functionality"}
     except Exception as e:
-        return JSONResponse(
+        # Failures are never cached: the next probe re-checks immediately
+        return ORJSONResponse(
             status_code=503,
             content={"status": "unhealthy", "error": str(e)}
         )
@@ -0,0 +1,36 @@
+"""
+Shared AWS clients.
+"""
+
+import boto3
+from botocore.config import Config
+
+from .config import settings
+
+# One DynamoDB resource for the whole app. botocore's default pool of 10
+# connections stalls under concurrency; a bigger pool with TCP keep-alive
+# keeps warm HTTPS connections available to every caller, and adaptive
+# retries back off cleanly on throttling.
+_BOTO_CONFIG = Config(
+    max_pool_connections=128,
+    tcp_keepalive=True,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+)
+
+dynamodb = boto3.resource(
+    "dynamodb",
+    region_name=settings.aws_region,
+    aws_access_key_id=settings.aws_access_key_id,
+    aws_secret_access_key=settings.aws_secret_access_key,
+    config=_BOTO_CONFIG,
+)
+
+_tables = {}
+
+
+def table(name: str):
+    """Return a cached Table binding for `name`."""
+    cached = _tables.get(name)
+    if cached is None:
+        cached = _tables.setdefault(name, dynamodb.Table(name))
+    return cached
@@ -27,6 +27,11 @@ class Settings(BaseSettings):
     secret_key: str = Field(..., env="SECRET_KEY")
     algorithm: str = Field(default="HS256", env="ALGORITHM")
     access_token_expire_minutes: int = Field(default=30, env="ACCESS_TOKEN_EXPIRE_MINUTES")
+    auth_user_cache_ttl: int = Field(default=300, env="AUTH_USER_CACHE_TTL")  # seconds
+
+    # Well-known token subjects (health checkers, workers) that have no user
+    # row and should not trigger a DynamoDB lookup on every request.
+    service_principal_subs: List[str] = Field(default_factory=list, env="SERVICE_PRINCIPAL_SUBS")
     
     #google OAuth Settings
     # Google OAuth (OpenID Connect)
@@ -2,12 +2,19 @@
 Request models.
 """
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import Optional
 
+# Shared validation config for request bodies: drop unknown fields instead of
+# carrying them through validation, and freeze instances — pydantic v2 skips
+# the per-field assignment machinery entirely for frozen models.
+_REQUEST_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
 
 class UserRegister(BaseModel):
     """User registration request."""
+    model_config = _REQUEST_CONFIG
+
     email: EmailStr
     password: str = Field(..., min_length=8)
     full_name: Optional[str] = None
@@ -15,10 +22,14 @@ class UserRegister(BaseModel):
 
 class UserLogin(BaseModel):
     """User login request."""
+    model_config = _REQUEST_CONFIG
+
     email: EmailStr
     password: str
 
 
 class ChatRequest(BaseModel):
     """Chat message request."""
-    user_message: str
\ No newline at end of file
+    model_config = _REQUEST_CONFIG
+
+    user_message: str
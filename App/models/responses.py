@@ -2,18 +2,26 @@
 Response models.
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
+# Responses are built once and serialized; see App.models.requests for why
+# frozen + extra="ignore" is the cheap configuration in pydantic v2.
+_RESPONSE_CONFIG = ConfigDict(extra="ignore", frozen=True)
+
 
 class Token(BaseModel):
     """JWT token response."""
+    model_config = _RESPONSE_CONFIG
+
     access_token: str
     token_type: str = "bearer"
 
 
 class UserResponse(BaseModel):
     """User data response."""
+    model_config = _RESPONSE_CONFIG
+
     user_id: str
     email: str
     full_name: Optional[str] = None
@@ -22,6 +30,8 @@ class UserResponse(BaseModel):
 
 class ChatResponse(BaseModel):
     """Chat response."""
+    model_config = _RESPONSE_CONFIG
+
     thread_id: str
     user_message: str
-    model_response: str
\ No newline at end of file
+    model_response: str
@@ -2,49 +2,72 @@
 Authentication service.
 """
 
-import boto3
+import asyncio
+
+from boto3.dynamodb.conditions import Key
+from boto3.dynamodb.types import TypeSerializer
 from botocore.exceptions import ClientError
 from datetime import datetime, timedelta
+from functools import lru_cache
+from threading import RLock
 import uuid
 from typing import Optional, Dict, Any
 
+from cachetools import TTLCache
+
+from App.core.aws import dynamodb, table
 from App.core.config import settings
 from App.core.security import verify_password, get_password_hash, create_access_token
+from App.utils.batching import BatchedGetItem
 from App.core.exceptions import (
     InvalidCredentialsError,
     DatabaseError,
     UserAlreadyExistsError,
 )
 
+# In-process cache for user records looked up by user_id. User items rarely
+# change, but get_user_by_id runs on every authenticated request; caching them
+# for a short TTL drops one DynamoDB round-trip per call. Shared across
+# AuthService instances so all entry points see the same entries.
+_user_cache = TTLCache(maxsize=5000, ttl=settings.auth_user_cache_ttl)
+_user_cache_lock = RLock()
+
+# Same idea for email lookups (login, registration pre-checks). Kept short so
+# a fresh registration is visible almost immediately.
+_email_cache = TTLCache(maxsize=10_000, ttl=30)
+
+# And for google_sub lookups on the OAuth callback path.
+_google_sub_cache = TTLCache(maxsize=10_000, ttl=30)
+
 
 class AuthService:
     """Handle user authentication."""
 
     def __init__(self):
-        self.dynamodb = boto3.resource(
-            "dynamodb",
-            region_name=settings.aws_region,
-            aws_access_key_id=settings.aws_access_key_id,
-            aws_secret_access_key=settings.aws_secret_access_key,
-        )
-        self.users_table = self.dynamodb.Table(settings.users_table)
+        # Shared application-wide resource; see App.core.aws for pool sizing.
+        self.dynamodb = dynamodb
+        self.users_table = table(settings.users_table)
+        self._batched_get = BatchedGetItem(self.dynamodb)
 
     # -------------------------------------------------------------------------
     # Existing: Local email/password registration
     # -------------------------------------------------------------------------
-    def register_user(self, email: str, password: str, full_name: Optional[str] = None) -> Dict[str, Any]:
+    async def register_user(self, email: str, password: str, full_name: Optional[str] = None) -> Dict[str, Any]:
         """
         Register a new user (local auth).
 
         Raises:
             UserAlreadyExistsError: If email already registered
         """
-        # Check if user exists (any provider)
-        if self.get_user_by_email(email):
+        # Check if user exists (any provider). The GSI query is a blocking
+        # boto3 call, so keep it off the event loop like the bcrypt work.
+        if await asyncio.to_thread(self.get_user_by_email, email):
             raise UserAlreadyExistsError(email)
 
-        user_id = str(uuid.uuid4())
-        hashed_password = get_password_hash(password)
+        user_id = uuid.uuid4().hex  # hex: same entropy, no dash formatting, 4 fewer key bytes
+        # bcrypt is compute-bound (~100ms at the configured cost); hash in a
+        # worker thread so the event loop keeps serving other requests.
+        hashed_password = await asyncio.to_thread(get_password_hash, password)
         current_time = datetime.utcnow().isoformat()
 
         user_data = {
@@ -58,11 +81,46 @@ class AuthService:
             "last_login_at": current_time,
         }
 
+        # One transactional write creates the user and reserves the email.
+        # The GSI pre-check above is a friendly fast path, but it's eventually
+        # consistent — two racing registrations can both pass it. The sentinel
+        # item (PK "email#<email>", no email attribute so it never shows up in
+        # the email-index) makes the address itself conditionally unique, so
+        # the loser of the race fails here instead of double-inserting.
+        serializer = TypeSerializer()
         try:
-            self.users_table.put_item(Item=user_data)
+            await asyncio.to_thread(
+                self.dynamodb.meta.client.transact_write_items,
+                TransactItems=[
+                    {
+                        "Put": {
+                            "TableName": settings.users_table,
+                            "Item": {k: serializer.serialize(v) for k, v in user_data.items()},
+                            "ConditionExpression": "attribute_not_exists(user_id)",
+                        }
+                    },
+                    {
+                        "Put": {
+                            "TableName": settings.users_table,
+                            "Item": {
+                                "user_id": serializer.serialize(f"email#{email}"),
+                                "reserved_by": serializer.serialize(user_id),
+                                "created_at": serializer.serialize(current_time),
+                            },
+                            "ConditionExpression": "attribute_not_exists(user_id)",
+                        }
+                    },
+                ]
+            )
         except ClientError as e:
+            if e.response.get("Error", {}).get("Code") == "TransactionCanceledException":
+                raise UserAlreadyExistsError(email)
             raise DatabaseError(f"Failed to create user: {str(e)}", e)
 
+        # Make the new account visible to cached email lookups immediately
+        with _user_cache_lock:
+            _email_cache.pop(email, None)
+
         access_token = create_access_token(
             data={"sub": user_id, "email": email},
             expires_delta=timedelta(minutes=settings.access_token_expire_minutes),
@@ -81,14 +139,14 @@ class AuthService:
     # -------------------------------------------------------------------------
     # Existing: Local email/password login
     # -------------------------------------------------------------------------
-    def login_user(self, email: str, password: str) -> Dict[str, Any]:
+    async def login_user(self, email: str, password: str) -> Dict[str, Any]:
         """
         Login user with email/password (local auth).
 
         Raises:
             InvalidCredentialsError: If credentials are wrong
         """
-        user = self.get_user_by_email(email)
+        user = await asyncio.to_thread(self.get_user_by_email, email)
         if not user:
             raise InvalidCredentialsError()
 
@@ -98,11 +156,13 @@ class AuthService:
             # but for your app UX you can choose to raise a more specific error later.
             raise InvalidCredentialsError()
 
-        if not verify_password(password, user.get("hashed_password", "")):
+        # Same story as hashing: the verify recomputes bcrypt, so keep it off
+        # the event loop.
+        if not await asyncio.to_thread(verify_password, password, user.get("hashed_password", "")):
             raise InvalidCredentialsError()
 
-        # Update last_login_at (best-effort)
-        self._touch_last_login(user["user_id"])
+        # Update last_login_at (best-effort, still a blocking write)
+        await asyncio.to_thread(self._touch_last_login, user["user_id"])
 
         access_token = create_access_token(
             data={"sub": user["user_id"], "email": email},
@@ -140,10 +200,13 @@ class AuthService:
         Returns:
             { "user": {...}, "access_token": "..." }
         """
-        # 1) Try to find by google_sub (scan for now; later replace with GSI)
+        # One timestamp for the whole login/registration flow
+        current_time = datetime.utcnow().isoformat()
+
+        # 1) Try to find by google_sub (indexed lookup via google_sub-index)
         user = self.get_user_by_google_sub(google_sub)
         if user:
-            self._touch_last_login(user["user_id"])
+            self._touch_last_login(user["user_id"], now=current_time)
             return self._issue_token_response(user)
 
         # 2) Collision check: same email already exists?
@@ -162,22 +225,22 @@ class AuthService:
                         UpdateExpression="SET google_sub = :gs, updated_at = :u",
                         ExpressionAttributeValues={
                             ":gs": google_sub,
-                            ":u": datetime.utcnow().isoformat(),
+                            ":u": current_time,
                         },
                     )
                 except ClientError:
                     pass
 
+                self._invalidate_user_cache(existing["user_id"])
                 existing["google_sub"] = google_sub
-                self._touch_last_login(existing["user_id"])
+                self._touch_last_login(existing["user_id"], now=current_time)
                 return self._issue_token_response(existing)
 
             # Any other weird case: fail closed
             raise UserAlreadyExistsError(email)
 
         # 3) Create new Google user
-        user_id = str(uuid.uuid4())
-        current_time = datetime.utcnow().isoformat()
+        user_id = uuid.uuid4().hex  # hex: same entropy, no dash formatting, 4 fewer key bytes
 
         user_data = {
             "user_id": user_id,
@@ -220,16 +283,20 @@ class AuthService:
             "access_token": access_token,
         }
 
-    def _touch_last_login(self, user_id: str) -> None:
+    def _touch_last_login(self, user_id: str, now: Optional[str] = None) -> None:
         """
         Best-effort update of last_login_at. Failure should not block login.
+
+        Callers that already computed a timestamp for this request can pass
+        it via `now` so the whole operation shares one value.
         """
         try:
             self.users_table.update_item(
                 Key={"user_id": user_id},
                 UpdateExpression="SET last_login_at = :t, updated_at = :t",
-                ExpressionAttributeValues={":t": datetime.utcnow().isoformat()},
+                ExpressionAttributeValues={":t": now or datetime.utcnow().isoformat()},
             )
+            self._invalidate_user_cache(user_id)
         except ClientError:
             return
 
@@ -237,33 +304,102 @@ class AuthService:
     # Existing: lookups (scan-based for now)
     # -------------------------------------------------------------------------
     def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
-        """Get user by email (scan for now; replace with GSI later)."""
+        """Get user by email via the email-index GSI (point lookup, not a scan)."""
+        with _user_cache_lock:
+            cached = _email_cache.get(email)
+        if cached is not None:
+            return cached
+
         try:
-            response = self.users_table.scan(
-                FilterExpression="email = :email",
-                ExpressionAttributeValues={":email": email},
+            response = self.users_table.query(
+                IndexName="email-index",
+                KeyConditionExpression=Key("email").eq(email),
+                Limit=1,
             )
             items = response.get("Items", [])
-            return items[0] if items else None
         except ClientError:
             return None
 
+        user = items[0] if items else None
+        if user:
+            with _user_cache_lock:
+                _email_cache[email] = user
+        return user
+
     def get_user_by_google_sub(self, google_sub: str) -> Optional[Dict[str, Any]]:
-        """Get user by google_sub (scan for now; replace with GSI later)."""
+        """Get user by google_sub via the google_sub-index GSI (point lookup, not a scan)."""
+        with _user_cache_lock:
+            cached = _google_sub_cache.get(google_sub)
+        if cached is not None:
+            return cached
+
         try:
-            response = self.users_table.scan(
-                FilterExpression="google_sub = :gs",
-                ExpressionAttributeValues={":gs": google_sub},
+            response = self.users_table.query(
+                IndexName="google_sub-index",
+                KeyConditionExpression=Key("google_sub").eq(google_sub),
+                Limit=1,
             )
             items = response.get("Items", [])
-            return items[0] if items else None
         except ClientError:
             return None
 
+        user = items[0] if items else None
+        if user:
+            with _user_cache_lock:
+                _google_sub_cache[google_sub] = user
+        return user
+
     def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """Get user by user_id."""
+        """Get user by user_id (cached with a short TTL)."""
+        with _user_cache_lock:
+            cached = _user_cache.get(user_id)
+        if cached is not None:
+            return cached
+
         try:
             response = self.users_table.get_item(Key={"user_id": user_id})
-            return response.get("Item")
+            user = response.get("Item")
+        except ClientError:
+            return None
+
+        if user:
+            with _user_cache_lock:
+                _user_cache[user_id] = user
+        return user
+
+    async def get_user_by_id_batched(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Async get_user_by_id for the request hot path: concurrent lookups
+        within the same flush window coalesce into one BatchGetItem.
+        """
+        with _user_cache_lock:
+            cached = _user_cache.get(user_id)
+        if cached is not None:
+            return cached
+
+        try:
+            user = await self._batched_get.get(settings.users_table, {"user_id": user_id})
         except ClientError:
             return None
+
+        if user:
+            with _user_cache_lock:
+                _user_cache[user_id] = user
+        return user
+
+    @staticmethod
+    def _invalidate_user_cache(user_id: str) -> None:
+        """Drop a cached user record after a mutation."""
+        with _user_cache_lock:
+            _user_cache.pop(user_id, None)
+
+
+@lru_cache(maxsize=1)
+def get_auth_service() -> AuthService:
+    """
+    Process-wide AuthService singleton.
+
+    Every module used to construct its own AuthService (and with it a boto3
+    resource + connection pool); share one instance instead.
+    """
+    return AuthService()
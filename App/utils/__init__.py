@@ -1,8 +1,10 @@
 from .validators import ThreadIDValidator
 from .serializers import CheckpointSerializer, extract_messages
+from .batching import BatchedGetItem
 
 __all__ = [
     "ThreadIDValidator",
     "CheckpointSerializer",
-    "extract_messages"
+    "extract_messages",
+    "BatchedGetItem"
 ]
\ No newline at end of file
@@ -0,0 +1,114 @@
+"""
+Request coalescing for DynamoDB point reads.
+"""
+
+import asyncio
+import functools
+from typing import Any, Dict, Optional, Tuple
+
+
+class BatchedGetItem:
+    """
+    Coalesce concurrent get_item calls into BatchGetItem requests.
+
+    Callers await `get(table_name, key)`; pending keys are flushed after a
+    short window (default 5 ms) or as soon as 100 unique keys are queued
+    (the BatchGetItem limit), collapsing N concurrent round-trips into one.
+    Concurrent requests for the same key share a single future.
+    """
+
+    MAX_BATCH_KEYS = 100
+
+    def __init__(self, dynamodb_resource, flush_interval: float = 0.005):
+        self._dynamodb = dynamodb_resource
+        self._flush_interval = flush_interval
+        # (table_name, frozen key) -> (future, key dict)
+        self._pending: Dict[Tuple[str, tuple], Tuple[asyncio.Future, Dict[str, Any]]] = {}
+        self._flusher: Optional[asyncio.Task] = None
+        # Table bindings for the single-get fallback, built once per table
+        self._tables: Dict[str, Any] = {}
+
+    async def get(self, table_name: str, key: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Fetch one item, batched with other in-flight requests.
+
+        Returns:
+            The item dict, or None if the key doesn't exist
+        """
+        loop = asyncio.get_running_loop()
+        pending_key = (table_name, tuple(sorted(key.items())))
+
+        entry = self._pending.get(pending_key)
+        if entry is not None:
+            return await entry[0]
+
+        future = loop.create_future()
+        self._pending[pending_key] = (future, dict(key))
+
+        if len(self._pending) >= self.MAX_BATCH_KEYS:
+            await self._flush()
+        elif self._flusher is None or self._flusher.done():
+            self._flusher = loop.create_task(self._flush_after_interval())
+
+        return await future
+
+    async def _flush_after_interval(self):
+        await asyncio.sleep(self._flush_interval)
+        await self._flush()
+
+    async def _flush(self):
+        batch, self._pending = self._pending, {}
+        if not batch:
+            return
+
+        request_items: Dict[str, Dict[str, Any]] = {}
+        for (table_name, _), (_, key) in batch.items():
+            request_items.setdefault(table_name, {"Keys": []})["Keys"].append(key)
+
+        loop = asyncio.get_running_loop()
+        try:
+            response = await loop.run_in_executor(
+                None,
+                functools.partial(self._dynamodb.batch_get_item, RequestItems=request_items)
+            )
+        except Exception as e:
+            for future, _ in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        responses = response.get("Responses", {})
+        unprocessed = response.get("UnprocessedKeys", {})
+
+        for (table_name, _), (future, key) in batch.items():
+            if future.done():
+                continue
+
+            # DynamoDB throttled this key out of the batch; fall back to a
+            # plain get_item rather than reporting a miss.
+            if any(key == k for k in unprocessed.get(table_name, {}).get("Keys", [])):
+                try:
+                    item = await loop.run_in_executor(
+                        None,
+                        functools.partial(self._get_single, table_name, key)
+                    )
+                    future.set_result(item)
+                except Exception as e:
+                    future.set_exception(e)
+                continue
+
+            match = None
+            for item in responses.get(table_name, []):
+                if all(item.get(attr) == value for attr, value in key.items()):
+                    match = item
+                    break
+            future.set_result(match)
+
+    def _get_single(self, table_name: str, key: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        # Cached Table binding: building one re-walks the boto3 resource
+        # model, which isn't worth repeating on every throttle fallback.
+        table = self._tables.get(table_name)
+        if table is None:
+            table = self._tables.setdefault(table_name, self._dynamodb.Table(table_name))
+        response = table.get_item(Key=key)
+        return response.get("Item")
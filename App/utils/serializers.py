@@ -8,6 +8,43 @@ from typing import Dict, Any, Union
 
 from ..core.exceptions import DeserializationError
 
+# Frame magic for zstd-compressed checkpoint blobs. The saver writes raw
+# msgpack today; sniffing the magic here means a compressing checkpointer can
+# be rolled out later without coordinating a reader deploy.
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _decode_exttype(code: int, data: bytes):
+    """
+    Decode msgpack ExtType objects.
+    Code 5 is used by LangChain for serialized messages.
+
+    Module-level (rather than a classmethod) so the recursive ext_hook is a
+    plain function reference — no bound-method allocation per ExtType.
+    """
+    if code == 5:
+        try:
+            unpacked = msgpack.unpackb(
+                data,
+                raw=False,
+                strict_map_key=False,
+                ext_hook=_decode_exttype
+            )
+
+            # LangChain format: [module, class, properties_dict]
+            if isinstance(unpacked, (list, tuple)) and len(unpacked) >= 3:
+                properties = unpacked[2]
+                return properties if isinstance(properties, dict) else unpacked
+
+            return unpacked
+
+        except Exception:
+            # If nested unpacking fails, return raw data
+            return data
+
+    # Unknown ExtType code
+    return msgpack.ExtType(code, data)
+
 
 class CheckpointSerializer:
     """Handles deserialization of checkpoint data."""
@@ -33,12 +70,17 @@ class CheckpointSerializer:
             # Validate not empty
             if len(raw_bytes) == 0:
                 raise DeserializationError("Checkpoint data is empty")
-            
+
+            # Transparently decompress zstd-framed blobs (old raw-msgpack
+            # items don't start with the magic and pass straight through)
+            if raw_bytes[:4] == _ZSTD_MAGIC:
+                raw_bytes = cls._decompress(raw_bytes)
+
             # Unpack msgpack
             return msgpack.unpackb(
                 raw_bytes,
                 raw=False,
-                ext_hook=cls._decode_exttype,
+                ext_hook=_decode_exttype,
                 strict_map_key=False
             )
             
@@ -51,54 +93,49 @@ class CheckpointSerializer:
         except Exception as e:
             raise DeserializationError(f"Unexpected error: {str(e)}", e)
     
+    @staticmethod
+    def _decompress(raw_bytes: bytes) -> bytes:
+        """Decompress a zstd-framed checkpoint blob."""
+        try:
+            import zstandard
+        except ImportError as e:
+            raise DeserializationError(
+                "Checkpoint is zstd-compressed but the zstandard package is not installed", e
+            )
+        try:
+            return zstandard.ZstdDecompressor().decompress(raw_bytes)
+        except zstandard.ZstdError as e:
+            raise DeserializationError(f"Invalid zstd frame: {str(e)}", e)
+
     @staticmethod
     def _to_bytes(checkpoint_blob: Union[bytes, str, Any]) -> bytes:
         """Convert checkpoint blob to bytes."""
-        # Handle boto3 Binary type
-        if hasattr(checkpoint_blob, '__class__') and 'Binary' in checkpoint_blob.__class__.__name__:
+        # Exact type checks ordered by frequency: DynamoDB hands us bytes (or
+        # its Binary wrapper) on virtually every call, so dispatch on
+        # type(...) identity instead of isinstance/attribute probing.
+        blob_type = type(checkpoint_blob)
+
+        if blob_type is bytes:
+            return checkpoint_blob
+
+        if blob_type is bytearray:
             return bytes(checkpoint_blob)
-        
-        # Handle bytes/bytearray
-        if isinstance(checkpoint_blob, (bytes, bytearray)):
+
+        # boto3 Binary wrapper
+        if blob_type.__name__ == 'Binary':
             return bytes(checkpoint_blob)
-        
-        # Handle base64 string
-        if isinstance(checkpoint_blob, str):
+
+        # Base64 string
+        if blob_type is str:
             try:
                 return base64.b64decode(checkpoint_blob)
             except Exception as e:
                 raise DeserializationError(f"Invalid base64 string: {str(e)}", e)
-        
-        raise DeserializationError(f"Unsupported checkpoint type: {type(checkpoint_blob)}")
+
+        raise DeserializationError(f"Unsupported checkpoint type: {blob_type}")
     
-    @classmethod
-    def _decode_exttype(cls, code: int, data: bytes):
-        """
-        Decode msgpack ExtType objects.
-        Code 5 is used by LangChain for serialized messages.
-        """
-        if code == 5:
-            try:
-                unpacked = msgpack.unpackb(
-                    data,
-                    raw=False,
-                    strict_map_key=False,
-                    ext_hook=cls._decode_exttype
-                )
-                
-                # LangChain format: [module, class, properties_dict]
-                if isinstance(unpacked, (list, tuple)) and len(unpacked) >= 3:
-                    properties = unpacked[2]
-                    return properties if isinstance(properties, dict) else unpacked
-                
-                return unpacked
-                
-            except Exception:
-                # If nested unpacking fails, return raw data
-                return data
-        
-        # Unknown ExtType code
-        return msgpack.ExtType(code, data)
+    # Kept as an attribute for callers that referenced the old classmethod
+    _decode_exttype = staticmethod(_decode_exttype)
 
 
 def extract_messages(checkpoint_data: Dict[str, Any]) -> list:
@@ -121,20 +158,14 @@ def extract_messages(checkpoint_data: Dict[str, Any]) -> list:
     
     if not isinstance(messages_raw, list):
         return []
-    
-    # Parse each message
-    parsed_messages = []
-    for idx, msg in enumerate(messages_raw):
-        try:
-            parsed = _parse_message(msg)
-            if parsed:
-                parsed_messages.append(parsed)
-        except Exception as e:
-            # Skip messages that can't be parsed
-            print(f"Warning: Failed to parse message at index {idx}: {e}")
-            continue
-    
-    return parsed_messages
+
+    # Parse each message. _parse_message is total for dict input (every
+    # content value is coerced to str before joining), so the old
+    # per-iteration try/except (frame setup per message, and checkpoints
+    # carry hundreds) is gone; non-dict entries are filtered up front
+    # instead of round-tripping through the parser.
+    parsed = [_parse_message(msg) for msg in messages_raw if isinstance(msg, dict)]
+    return [p for p in parsed if p]
 
 
 def _parse_message(msg: Any) -> dict:
@@ -149,7 +180,11 @@ def _parse_message(msg: Any) -> dict:
         text_parts = []
         for item in content:
             if isinstance(item, dict) and item.get("type") == "text":
-                text_parts.append(item.get("text", ""))
+                # Coerce: a malformed part with a non-string "text" value
+                # must not make the join below raise — extract_messages
+                # relies on this function being total for dict input.
+                text = item.get("text", "")
+                text_parts.append(text if isinstance(text, str) else str(text))
         content = " ".join(text_parts) if text_parts else ""
     
     # Ensure content is a string
@@ -2,49 +2,52 @@
 Input validation utilities.
 """
 
-import re
+import string
 from ..core.exceptions import InvalidThreadIDError
 
 
 class ThreadIDValidator:
     """Validator for thread IDs."""
-    
-    # Only alphanumeric, hyphens, and underscores
-    VALID_PATTERN = re.compile(r'^[a-zA-Z0-9_][a-zA-Z0-9_@-]*$')
+
+    # Only alphanumeric, hyphens, and underscores. Frozenset membership per
+    # character beats the equivalent regex ([a-zA-Z0-9_][a-zA-Z0-9_@-]*) on
+    # the short ids this sees, with no pattern-engine overhead.
+    FIRST_CHARS = frozenset(string.ascii_letters + string.digits + '_')
+    VALID_CHARS = frozenset(string.ascii_letters + string.digits + '_@-')
     MAX_LENGTH = 256
-    
+
     @classmethod
     def validate(cls, thread_id: str) -> str:
         """
         Validate thread_id format.
-        
+
         Args:
             thread_id: Thread ID to validate
-            
+
         Returns:
             Validated thread_id
-            
+
         Raises:
             InvalidThreadIDError: If validation fails
         """
         # Check if empty
         if not thread_id or not thread_id.strip():
             raise InvalidThreadIDError(thread_id, "thread_id cannot be empty")
-        
+
         thread_id = thread_id.strip()
-        
+
         # Check length
         if len(thread_id) > cls.MAX_LENGTH:
             raise InvalidThreadIDError(
                 thread_id,
                 f"thread_id exceeds maximum length of {cls.MAX_LENGTH}"
             )
-        
-        # Check pattern
-        if not cls.VALID_PATTERN.match(thread_id):
+
+        # Check characters: first from FIRST_CHARS, the rest from VALID_CHARS
+        if thread_id[0] not in cls.FIRST_CHARS or not cls.VALID_CHARS.issuperset(thread_id):
             raise InvalidThreadIDError(
                 thread_id,
                 "thread_id can only contain alphanumeric characters, hyphens, and underscores"
             )
-        
-        return thread_id
\ No newline at end of file
+
+        return thread_id
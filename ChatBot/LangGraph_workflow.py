@@ -1,51 +1,139 @@
-from datetime import datetime
-from typing import Annotated, List, TypedDict
+import hashlib
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Annotated, List, Literal, TypedDict
+
+from cachetools import LRUCache
+from pydantic import BaseModel
 from langchain_google_genai import ChatGoogleGenerativeAI, GoogleGenerativeAIEmbeddings
 from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import StateGraph, MessagesState, START, END, add_messages
-from langchain_core.messages import HumanMessage, BaseMessage, SystemMessage
+from langchain_core.messages import AIMessage, HumanMessage, BaseMessage, SystemMessage
+from langchain_core.messages.utils import count_tokens_approximately, trim_messages
 from dotenv import load_dotenv
+import logging
 import os
-import ast
 from pinecone import Pinecone as pc
 from langgraph_dynamodb_checkpoint import DynamoDBSaver
 
 load_dotenv()
 
+# Lazy %-style logging: the message is only formatted when the level is
+# enabled, unlike the old print(f"...") calls which always built the string
+# and flushed stdout. The formatter supplies the timestamp.
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    format="%(asctime)s %(levelname)s %(name)s %(message)s",
+)
+logger = logging.getLogger(__name__)
+
 os.environ["GOOGLE_API_KEY"] = os.getenv("GOOGLE_API_KEY")
 CHECKPOINTER_TABLE = os.getenv("CHECKPOINTER_TABLE", "langgraph-checkpoints")
 
-# models used in answering
-school_model = ChatGoogleGenerativeAI(
+# models used in answering. school_model and chat_model were two identical
+# ChatGoogleGenerativeAI instances, each with its own HTTP client and auth
+# state; one shared instance keeps a single warm connection pool. If the two
+# roles ever need different settings, bind() shares the underlying client.
+llm = ChatGoogleGenerativeAI(
     model="gemini-3-pro-preview",
     temperature=0,
     max_tokens=None,
     timeout=None,
     max_retries=2,
 )
+school_model = chat_model = llm
 embeddings_model = GoogleGenerativeAIEmbeddings(model="models/gemini-embedding-001")
-chat_model = ChatGoogleGenerativeAI(
-    model="gemini-3-pro-preview",
-    temperature=0,
-    max_tokens=None,
-    timeout=None,
-    max_retries=2,
-)
 
 # pinecone setup would go here if needed
 pc_client = pc(api_key=os.getenv("PINECONE_API_KEY"))
 pincecone_index_name = os.getenv("PINECONE_INDEX_NAME", "ut-multi-campus-v1")
 index = pc_client.Index(pincecone_index_name)
 
+ALL_CAMPUSES = (
+    "UT_Arlington",
+    "UT_Austin",
+    "UT_Dallas",
+    "UT_El_Paso",
+    "UT_Health_Houston",
+    "UT_Health_San_Antonio",
+    "UT_Health_Science_Center_Tyler",
+    "UT_MD_Anderson",
+    "UT_Medical_Branch_Galveston",
+    "UT_Permian_Basin",
+    "UT_Rio_Grande_Valley",
+    "UT_San_Antonio",
+    "UT_Southwestern",
+    "UT_Tyler",
+)
 
-
-# Nodes and State Definitions 
+# System messages are identical on every invocation; build them once instead
+# of re-allocating the prompt strings per request.
+_SCHOOL_SYSTEM_MSG = SystemMessage(content="You are an assistant that identifies which UT campuses a query refers to based on the provided context. Analyze the human query and return all campuses explicitly or implicitly mentioned. If no specific campus is mentioned, return ['All'].")
+_CHATBOT_SYSTEM_MSG = SystemMessage(content="You are an assistant specializing in questions about the University of Texas system campuses. When context is available and relevant, use it as your primary source. If the context does not include the answer, use your broader knowledge to help, but never contradict the context. Keep responses concise and student-friendly.")
+
+# Pool for fanning the per-campus Pinecone queries out in parallel; sized to
+# cover the full campus list in one wave.
+_retrieval_executor = ThreadPoolExecutor(max_workers=len(ALL_CAMPUSES))
+
+class CampusList(BaseModel):
+    """Structured output for the campus-identification model."""
+    campuses: List[Literal[
+        "UT_Arlington",
+        "UT_Austin",
+        "UT_Dallas",
+        "UT_El_Paso",
+        "UT_Health_Houston",
+        "UT_Health_San_Antonio",
+        "UT_Health_Science_Center_Tyler",
+        "UT_MD_Anderson",
+        "UT_Medical_Branch_Galveston",
+        "UT_Permian_Basin",
+        "UT_Rio_Grande_Valley",
+        "UT_San_Antonio",
+        "UT_Southwestern",
+        "UT_Tyler",
+        "All",
+    ]]
+
+
+# Bound once at import: the model returns a validated CampusList instead of
+# prose that has to be literal_eval'd back into a Python list.
+school_model_structured = school_model.with_structured_output(CampusList)
+
+# Content-addressed cache of query embeddings: repeat/near-repeat questions
+# ("tuition UT Austin") skip the remote embedding call entirely. Keyed by a
+# hash of the normalized query so trivial case/whitespace variants share an
+# entry. Vectors are stored as float32 arrays (~12 KB for 3072 dims) rather
+# than lists of Python floats (50-100 KB each), so a full cache tops out
+# around 50 MB instead of multiple GB.
+_embedding_cache = LRUCache(maxsize=4096)
+_embedding_cache_lock = Lock()
+
+
+
+def _merge_error(a: str, b: str) -> str:
+    """Reducer for the error channel: the newest write wins.
+
+    specific_school and vectorize_query run in the same superstep and can
+    both fail; on a plain LastValue channel two writes in one step raise
+    InvalidUpdateError and the request 500s instead of reaching the error
+    responder. Taking the latest write merges concurrent failures (either
+    message is a fine reply) while still letting checking_query's per-run
+    "" reset clear a checkpointed error — which a `b or a` reducer would
+    silently keep alive.
+    """
+    return b
+
+
+# Nodes and State Definitions
 class State(TypedDict, total=False):
     query: str
     campus_list: List[str]
     query_embedding: List[float]
     retrieved_docs: List[dict]
     full_context_documents: str
+    error: Annotated[str, _merge_error]
     messages: Annotated[List[BaseMessage], add_messages]
 
 
@@ -58,14 +146,17 @@ def checking_query(state: State) -> State:
                 last_human_message = msg
                 break
         if not last_human_message or not str(last_human_message.content).split():
-            print(f'LOG: No query provided : FUNCTION -> saving_query : time -> {datetime.now().isoformat(timespec="seconds")}')
-            return SystemError("Please provide a valid query.")
+            logger.warning("No query provided : FUNCTION -> checking_query")
+            return {"error": "Please provide a valid query."}
         query = last_human_message.content.strip()
-        print(f'LOG: Received query -> "{query}" : FUNCTION -> checking_query : time -> {datetime.now().isoformat(timespec="seconds")}')
-        return {"query": query}
+        logger.info('Received query -> "%s" : FUNCTION -> checking_query', query)
+        # The error channel is checkpointed, so a failure on a previous turn
+        # would otherwise be restored and re-route every later message to the
+        # error responder; clear it explicitly at the start of each run.
+        return {"query": query, "error": ""}
     except Exception as e:
-        print(f'LOG: Error in checking_query -> {str(e)} : FUNCTION -> checking_query : time -> {datetime.now().isoformat(timespec="seconds")}')
-        return SystemError("An error occurred while processing the query.")
+        logger.error("Error in checking_query -> %s : FUNCTION -> checking_query", e)
+        return {"error": "An error occurred while processing the query."}
 
 
 
@@ -73,11 +164,11 @@ def specific_school(state: State) -> State:
     query = state.get("query")
     messages = state.get("messages", [])
 
-    system_prompt = "You are an assistant that identifies which UT campuses a query refers to based on the provided context. The full list of valid campuses is: ['UT_Arlington','UT_Austin','UT_Dallas','UT_El_Paso','UT_Health_Houston','UT_Health_San_Antonio','UT_Health_Science_Center_Tyler','UT_MD_Anderson','UT_Medical_Branch_Galveston','UT_Permian_Basin','UT_Rio_Grande_Valley','UT_San_Antonio','UT_Southwestern','UT_Tyler']. Analyze the human query and return ONLY a Python list of all campuses explicitly or implicitly mentioned. If no specific campus is mentioned, return ['All']."
-
     full_context = []
-    
-    for messsage in messages:
+
+    # Campus identification only needs recent context, not the whole thread;
+    # the last few turns bound the prompt size on long conversations.
+    for messsage in messages[-10:]:
         if isinstance(messsage, HumanMessage):
             full_context.append(f"User: {messsage.content}")
         elif isinstance(messsage, SystemMessage):
@@ -85,133 +176,189 @@ def specific_school(state: State) -> State:
     full_context = "\n".join(full_context)
 
     lc_messages: List[BaseMessage] = [
-        SystemMessage(content=system_prompt),
+        _SCHOOL_SYSTEM_MSG,
         SystemMessage(content=f"Context Documents:\n{full_context}"),
         HumanMessage(content=query),
     ]
 
-    ai_msg = school_model.invoke(lc_messages)
-    raw_text = ai_msg.content[0]["text"]  
-    campuses = ast.literal_eval(raw_text) 
+    result = school_model_structured.invoke(lc_messages)
+    campuses = result.campuses
 
     if not campuses:
-        print(f'LOG: No campuses identified from query -> "{query}" : FUNCTION -> specific_school : time -> {datetime.now().isoformat(timespec="seconds")}')
-        return SystemError("Please mentioned which UT campus you are interested in.")
-    
-    print(f'LOG: Returning campuses -> {campuses} from query -> "{query}" : FUNCTION -> specific_school : time -> {datetime.now().isoformat(timespec="seconds")}')
+        logger.warning('No campuses identified from query -> "%s" : FUNCTION -> specific_school', query)
+        return {"error": "Please mentioned which UT campus you are interested in."}
+
+    logger.info('Returning campuses -> %s from query -> "%s" : FUNCTION -> specific_school', campuses, query)
     return {"campus_list": campuses}
 
 
 def vectorize_query(state: State) -> State:
     query = state.get("query")
-    vectorize_query = embeddings_model.embed_query(query)
+
+    cache_key = hashlib.sha1(query.strip().lower().encode()).digest()
+    with _embedding_cache_lock:
+        cached = _embedding_cache.get(cache_key)
+
+    if cached is not None:
+        vectorize_query = cached.tolist()
+    else:
+        vectorize_query = embeddings_model.embed_query(query)
+        if vectorize_query:
+            with _embedding_cache_lock:
+                _embedding_cache[cache_key] = array("f", vectorize_query)
 
     if not vectorize_query:
-        print(f'LOG: Failed to vectorize query -> "{query}" : FUNCTION -> vectorize_query : time -> {datetime.now().isoformat(timespec="seconds")}')
-        return SystemError("Failed to vectorize the query.")
-    
-    print(f'LOG: Returning vectorized query  ->  from query -> "{query}" : FUNCTION -> vectorize_query : time -> {datetime.now().isoformat(timespec="seconds")}')
+        logger.warning('Failed to vectorize query -> "%s" : FUNCTION -> vectorize_query', query)
+        return {"error": "Failed to vectorize the query."}
+
+    logger.info('Returning vectorized query from query -> "%s" : FUNCTION -> vectorize_query', query)
     return {"query_embedding" : vectorize_query} 
 
 def retrive_documents(state: State) -> State:
     # This function would implement retrieval logic from Pinecone using the query_embedding
+    # Join point of the parallel branches: if one of them already failed,
+    # carry its error through to the router untouched.
+    if state.get("error"):
+        return {}
+
     query_embedding = state.get("query_embedding")
     campuses = state.get("campus_list")
     # just making sure it does not give issue in development if something bad happens
-    if not query_embedding: 
-        print(f'LOG: No query embedding found : FUNCTION -> retrive_documents : time -> {datetime.now().isoformat(timespec="seconds")}')
-        return SystemError("No query embedding found for document retrieval.")
+    if not query_embedding:
+        logger.warning("No query embedding found : FUNCTION -> retrive_documents")
+        return {"error": "No query embedding found for document retrieval."}
 
     if not campuses:
-        print(f'LOG: No campuses found : FUNCTION -> retrive_documents : time -> {datetime.now().isoformat(timespec="seconds")}')
-        return SystemError("No campuses found for document retrieval.")
+        logger.warning("No campuses found : FUNCTION -> retrive_documents")
+        return {"error": "No campuses found for document retrieval."}
 
     try:
         retrieve_docs = []
-        print(f'LOG: Retrieving documents for campuses -> {campuses} : FUNCTION -> retrive_documents : time -> {datetime.now().isoformat(timespec="seconds")}')
+        logger.info("Retrieving documents for campuses -> %s : FUNCTION -> retrive_documents", campuses)
         if campuses != ['All']:
-            for campus in campuses:
-                docs_matched = index.query(
-                    vector=query_embedding,
-                    top_k=5,
-                    include_metadata=True,
-                    filter={"university": campus}
-                )
-                for doc in docs_matched.matches:
-                    retrieve_docs.append({
-                        "id": doc.id,
-                        "score": float(doc.score),
-                        "metadata": doc.metadata
-                    })
+            # One filtered query instead of a round-trip per campus; the $in
+            # filter lets Pinecone do the fan-out server-side.
+            docs_matched = index.query(
+                vector=query_embedding,
+                top_k=5 * len(campuses),
+                include_metadata=True,
+                filter={"university": {"$in": campuses}}
+            )
+            for doc in docs_matched.matches:
+                retrieve_docs.append({
+                    "id": doc.id,
+                    "score": float(doc.score),
+                    "metadata": doc.metadata
+                })
         else:
-            ALL_CAMPUSES = [
-                "UT_Arlington",
-                "UT_Austin",
-                "UT_Dallas",
-                "UT_El_Paso",
-                "UT_Health_Houston",
-                "UT_Health_San_Antonio",
-                "UT_Health_Science_Center_Tyler",
-                "UT_MD_Anderson",
-                "UT_Medical_Branch_Galveston",
-                "UT_Permian_Basin",
-                "UT_Rio_Grande_Valley",
-                "UT_San_Antonio",
-                "UT_Southwestern",
-                "UT_Tyler"
-            ]
-            print(f'LOG: Retrieving documents for all campuses : FUNCTION -> retrive_documents : time -> {datetime.now().isoformat(timespec="seconds")}')
-            for campus in ALL_CAMPUSES:
-                docs_matched = index.query(
+            logger.info("Retrieving documents for all campuses : FUNCTION -> retrive_documents")
+            # Keep the per-campus top_k=2 queries (a single unfiltered query
+            # would let one campus crowd out the rest), but run them
+            # concurrently — 14 sequential RTTs become one round-trip of
+            # wall-clock time.
+            def _query_campus(campus):
+                return index.query(
                     vector=query_embedding,
                     top_k=2,
                     include_metadata=True,
                     filter={"university": campus}
                 )
+
+            for docs_matched in _retrieval_executor.map(_query_campus, ALL_CAMPUSES):
                 for doc in docs_matched.matches:
                     retrieve_docs.append({
                         "id": doc.id,
                         "score": doc.score,
                         "metadata": doc.metadata
                     })
-        print(f'LOG: Retrieved {len(retrieve_docs)} documents : FUNCTION -> retrive_documents : time -> {datetime.now().isoformat(timespec="seconds")}')
+        # The same document can match under several campuses / overlapping
+        # filters; duplicates would just repeat themselves in the LLM
+        # context. Keep the first (they're identical), then cap at the 20
+        # best-scoring docs overall.
+        seen = set()
+        unique_docs = []
+        for doc in retrieve_docs:
+            if doc["id"] in seen:
+                continue
+            seen.add(doc["id"])
+            unique_docs.append(doc)
+        unique_docs.sort(key=lambda d: d["score"], reverse=True)
+        retrieve_docs = unique_docs[:20]
+
+        logger.info("Retrieved %d documents : FUNCTION -> retrive_documents", len(retrieve_docs))
         return {"retrieved_docs": retrieve_docs}
     except Exception as e:
-        print(f'LOG: Error during document retrieval -> {str(e)} : FUNCTION -> retrive_documents : time -> {datetime.now().isoformat(timespec="seconds")}')
-        return SystemError("An error occurred during document retrieval.")
+        logger.error("Error during document retrieval -> %s : FUNCTION -> retrive_documents", e)
+        return {"error": "An error occurred during document retrieval."}
 
     
 def prepare_docs(state: State) -> State:
     retrieved_docs = state.get("retrieved_docs")
+    if not retrieved_docs:
+        # Nothing retrieved; hand the chatbot an empty context rather than
+        # formatting an empty list.
+        return {"full_context_documents": ""}
+
     context_documents = []
-    print(f'LOG: Preparing documents for context : FUNCTION -> prepare_docs : time -> {datetime.now().isoformat(timespec="seconds")}')
+    logger.info("Preparing documents for context : FUNCTION -> prepare_docs")
     for docs in retrieved_docs:
-        # print(f'LOG: Retrieved doc -> {docs} : FUNCTION -> prepare_docs : time -> {datetime.now().isoformat(timespec="seconds")}')
+        # logger.debug("Retrieved doc -> %s : FUNCTION -> prepare_docs", docs)
         metadata = docs.get('metadata', {})
         text = metadata.get('text', '')
         title = metadata.get('title', 'No Title')
         university = metadata.get('university', 'Unknown University')
         context_documents.append(f"Title: {title}\nUniversity: {university}\nContent: {text}\n")
-    print(f'LOG: Prepared {len(context_documents)} documents for context : FUNCTION -> prepare_docs : time -> {datetime.now().isoformat(timespec="seconds")}')
+    logger.info("Prepared %d documents for context : FUNCTION -> prepare_docs", len(context_documents))
     full_context = "\n---\n".join(context_documents)
     return {"full_context_documents": full_context}
 
 def chatbot_node(state: State) -> State:
     full_context = state["full_context_documents"]
     messages = state.get("messages", [])
-    print(f'LOG: Generating chatbot response : FUNCTION -> chatbot_node : time -> {datetime.now().isoformat(timespec="seconds")}')
-    system_prompt = "You are an assistant specializing in questions about the University of Texas system campuses. When context is available and relevant, use it as your primary source. If the context does not include the answer, use your broader knowledge to help, but never contradict the context. Keep responses concise and student-friendly."
-    lc_messages: List[BaseMessage] = [
-        SystemMessage(content=system_prompt),
-        SystemMessage(content=f"Context Documents:\n{full_context}"),
-    ]
-    lc_messages.extend(messages) 
-    print(f'LOG: Final messages sent to chatbot model : FUNCTION -> chatbot_node : time -> {datetime.now().isoformat(timespec="seconds")}')
+    logger.info("Generating chatbot response : FUNCTION -> chatbot_node")
+    lc_messages: List[BaseMessage] = [_CHATBOT_SYSTEM_MSG]
+    if full_context:
+        # No point spending input tokens on an empty context header
+        lc_messages.append(SystemMessage(content=f"Context Documents:\n{full_context}"))
+    # Sliding-window trim: long threads otherwise ship the entire history to
+    # the model every turn, and input tokens grow without bound. Keep the most
+    # recent turns under a fixed budget (approximate counting — no extra API
+    # call), starting on a human message so the window stays well-formed.
+    lc_messages.extend(trim_messages(
+        messages,
+        max_tokens=4000,
+        token_counter=count_tokens_approximately,
+        strategy="last",
+        start_on="human",
+        include_system=False,
+    ))
+    logger.debug("Final messages sent to chatbot model : FUNCTION -> chatbot_node")
     ai_msg = chat_model.invoke(lc_messages)
-    print(f'LOG: Chatbot response generated : FUNCTION -> chatbot_node : time -> {datetime.now().isoformat(timespec="seconds")}')
+    logger.info("Chatbot response generated : FUNCTION -> chatbot_node")
     return {"messages": [ai_msg]}
 
 
+def error_responder(state: State) -> State:
+    """Turn a short-circuited error into the reply the user sees."""
+    return {"messages": [AIMessage(content=state.get("error", "An error occurred while processing the query."))]}
+
+
+def _route_on_error(state: State) -> str:
+    """Conditional-edge router: jump to the error responder when a node set state["error"]."""
+    return "error" if state.get("error") else "ok"
+
+
+def _route_after_checking(state: State):
+    """
+    Fan out after validation: specific_school (LLM) and vectorize_query
+    (embedding) both depend only on the query, so they run in parallel and
+    the graph joins again at retrive_documents.
+    """
+    if state.get("error"):
+        return "error_responder"
+    return ["specific_school", "vectorize_query"]
+
+
 
 #---------------------------------------------------------------------------------------------------------
 # Building the state graph
@@ -224,27 +371,31 @@ builder.add_node("vectorize_query", vectorize_query)
 builder.add_node("retrive_documents", retrive_documents)
 builder.add_node("prepare_docs", prepare_docs)
 builder.add_node("chatbot", chatbot_node)
+builder.add_node("error_responder", error_responder)
 
-# Defining edges
+# Defining edges. Nodes that can fail report {"error": ...} and route
+# straight to the error responder, so a bad query never reaches the
+# embedding/retrieval/LLM steps further down the pipeline.
 builder.add_edge(
     START,
     "checking_query",
 )
-builder.add_edge(
+builder.add_conditional_edges(
     "checking_query",
-    "specific_school",
+    _route_after_checking,
 )
 builder.add_edge(
     "specific_school",
-    "vectorize_query",
+    "retrive_documents",
 )
 builder.add_edge(
     "vectorize_query",
     "retrive_documents",
 )
-builder.add_edge(
+builder.add_conditional_edges(
     "retrive_documents",
-    "prepare_docs",
+    _route_on_error,
+    {"error": "error_responder", "ok": "prepare_docs"},
 )
 builder.add_edge(
     "prepare_docs",
@@ -254,11 +405,19 @@ builder.add_edge(
     "chatbot",
     END,
 )
+builder.add_edge(
+    "error_responder",
+    END,
+)
 
+# One saver + one compiled graph per process: this module is imported once
+# and `app` is shared across all requests. The old 5 RCU/WCU caps throttled
+# the checkpointer under any real concurrency (every chat turn reads and
+# writes a checkpoint), turning load into retry storms.
 saver = DynamoDBSaver(
     table_name=CHECKPOINTER_TABLE,
-    max_read_request_units=5,  # Optional, default is 100
-    max_write_request_units=5,  # Optional, default is 100
+    max_read_request_units=int(os.getenv("CHECKPOINTER_MAX_RCU", "200")),
+    max_write_request_units=int(os.getenv("CHECKPOINTER_MAX_WCU", "100")),
 )
 
 app = builder.compile(checkpointer=saver)
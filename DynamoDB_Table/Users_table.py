@@ -10,7 +10,25 @@ try:
             {'AttributeName': 'user_id', 'KeyType': 'HASH'}
         ],
         AttributeDefinitions=[
-            {'AttributeName': 'user_id', 'AttributeType': 'S'}
+            {'AttributeName': 'user_id', 'AttributeType': 'S'},
+            {'AttributeName': 'email', 'AttributeType': 'S'},
+            {'AttributeName': 'google_sub', 'AttributeType': 'S'}
+        ],
+        GlobalSecondaryIndexes=[
+            {
+                'IndexName': 'email-index',
+                'KeySchema': [
+                    {'AttributeName': 'email', 'KeyType': 'HASH'}
+                ],
+                'Projection': {'ProjectionType': 'ALL'}
+            },
+            {
+                'IndexName': 'google_sub-index',
+                'KeySchema': [
+                    {'AttributeName': 'google_sub', 'KeyType': 'HASH'}
+                ],
+                'Projection': {'ProjectionType': 'ALL'}
+            }
         ],
         BillingMode='PAY_PER_REQUEST'
     )
@@ -1,15 +1,23 @@
+import argparse
 import requests
-from bs4 import BeautifulSoup
-import PyPDF2
-import io
-import json
+from urllib3.util.retry import Retry
+from selectolax.parser import HTMLParser
+import pypdfium2 as pdfium
+import orjson
 import os
 from datetime import datetime
 from urllib.parse import urljoin, urlparse
 import time
 import re
 import unicodedata
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+    FIRST_COMPLETED,
+)
 import threading
 
 class TextCleaner:
@@ -23,6 +31,26 @@ class TextCleaner:
             r'follow us on', r'share this page', r'print this page',
             r'back to top', r'cookie policy', r'powered by.*', r'site by.*',
         ]
+        # Compile every pattern once; clean() runs on every page and PDF, and
+        # re.sub with a raw string re-hits the re module's pattern cache each
+        # call. The boilerplate list also collapses into one alternation so a
+        # single pass over the text replaces fourteen.
+        self._boiler_re = re.compile(
+            '|'.join(f'(?:{p})' for p in self.boilerplate_patterns), re.IGNORECASE
+        )
+        self._ws_re = re.compile(r' +')
+        self._nl_re = re.compile(r'\n\s*\n\s*\n+')
+        self._pagenum_re = re.compile(r'^\d+$', re.MULTILINE)
+        self._pageof_re = re.compile(r'(Page \d+ of \d+)', re.IGNORECASE)
+        self._bullet_re = re.compile(r'[•·∙●○■□▪▫]')
+        self._url_re = re.compile(r'https?://[^\s]+')
+        self._email_re = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+        # One-pass codepoint translation for the unicode fixups below; nine
+        # chained str.replace calls each copied the whole text.
+        self._trans = str.maketrans({
+            '\u2018': "'", '\u2019': "'", '\u201c': '"', '\u201d': '"',
+            '\u2013': '-', '\u2014': '-', '\u2026': '...', '\xa0': ' ', '\u200b': '',
+        })
 
     def clean(self, text: str) -> str:
         if not text:
@@ -32,20 +60,14 @@ class TextCleaner:
         text = unicodedata.normalize('NFC', text)
         
         # Fix common unicode issues
-        replacements = {
-            '\u2018': "'", '\u2019': "'", '\u201c': '"', '\u201d': '"',
-            '\u2013': '-', '\u2014': '-', '\u2026': '...', '\xa0': ' ', '\u200b': '',
-        }
-        for old, new in replacements.items():
-            text = text.replace(old, new)
+        text = text.translate(self._trans)
         
         # Remove boilerplate
-        for pattern in self.boilerplate_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        text = self._boiler_re.sub('', text)
         
         # Clean whitespace
-        text = re.sub(r' +', ' ', text)
-        text = re.sub(r'\n\s*\n\s*\n+', '\n\n', text)
+        text = self._ws_re.sub(' ', text)
+        text = self._nl_re.sub('\n\n', text)
         
         # Remove very short lines (navigation items)
         lines = text.split('\n')
@@ -53,29 +75,75 @@ class TextCleaner:
         text = '\n'.join(lines)
         
         # Fix PDF artifacts
-        text = re.sub(r'^\d+$', '', text, flags=re.MULTILINE)
-        text = re.sub(r'(Page \d+ of \d+)', '', text, flags=re.IGNORECASE)
-        text = re.sub(r'[•·∙●○■□▪▫]', '* ', text)
+        text = self._pagenum_re.sub('', text)
+        text = self._pageof_re.sub('', text)
+        text = self._bullet_re.sub('* ', text)
         
         # Normalize URLs and emails
-        text = re.sub(r'https?://[^\s]+', '[URL]', text)
-        text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[EMAIL]', text)
+        text = self._url_re.sub('[URL]', text)
+        text = self._email_re.sub('[EMAIL]', text)
         
         return text.strip()
     
     def chunk_text(self, text: str, chunk_size=512, overlap=50) -> list:
         """Split text into overlapping chunks"""
-        words = text.split()
+        return [chunk for chunk, _ in self.chunk_words(text.split(), chunk_size, overlap)]
+
+    def chunk_words(self, words: list, chunk_size=512, overlap=50) -> list:
+        """
+        Chunk an already-split word list into (chunk, word_count) pairs.
+
+        Callers that need word counts anyway split once and pass the list in;
+        the slice length IS the chunk's word count, so no chunk is ever
+        re-split just to count it.
+
+        Chunks are cut as slices of one joined string: with per-word start
+        offsets precomputed, each chunk is a single substring copy instead
+        of a fresh list plus a ' '.join per chunk.
+        """
+        joined = ' '.join(words)
+        offsets = [0]
+        running = 0
+        for word in words:
+            running += len(word) + 1
+            offsets.append(running)
+
         chunks = []
-        
-        for i in range(0, len(words), chunk_size - overlap):
-            chunk = ' '.join(words[i:i + chunk_size])
-            if len(chunk.split()) >= 20:  # At least 20 words
-                chunks.append(chunk)
-        
+        n = len(words)
+
+        for i in range(0, n, chunk_size - overlap):
+            j = min(i + chunk_size, n)
+            if j - i >= 20:  # At least 20 words
+                chunks.append((joined[offsets[i]:offsets[j] - 1], j - i))
+
         return chunks
 
 
+class RateLimiter:
+    """Per-host politeness limiter: at most one request per interval per host.
+
+    Workers used to sleep an unconditional second after every page, which
+    idles the thread without actually bounding per-host QPS once fetches run
+    in parallel. Here each netloc gets a next-allowed timestamp; acquire()
+    claims a slot under the lock and sleeps only the remaining delta, so
+    threads hitting different hosts never wait on each other.
+    """
+
+    def __init__(self, interval=1.0):
+        self.interval = interval
+        self._next_time = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, netloc):
+        with self._lock:
+            now = time.monotonic()
+            ready = self._next_time.get(netloc, now)
+            self._next_time[netloc] = max(ready, now) + self.interval
+        wait = ready - now
+        if wait > 0:
+            time.sleep(wait)
+
+
 class UniversityScraper:
     def __init__(self, base_url, university_name, output_dir='scraped_data'):
         self.base_url = base_url
@@ -95,6 +163,32 @@ class UniversityScraper:
         self.headers = {
             'User-Agent': 'UT-Chatbot-Scraper (Educational Use - Contact: ""@gmail.com)'
         }
+        
+        # One Session per scraper: keep-alive reuses TCP+TLS connections to
+        # the school's host instead of a fresh handshake per request, with a
+        # pool sized for the crawl's thread fan-out and a couple of retries
+        # for flaky pages.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=2, backoff_factor=0.3),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # PDFs download/extract on their own small pool so a page's PDFs
+        # don't block discovery of the next page; save_documents drains it.
+        self.pdf_pool = ThreadPoolExecutor(max_workers=6)
+        
+        # Politeness: <= 1 request/sec per host, enforced at fetch time
+        self.rate_limiter = RateLimiter(interval=1.0)
+
+        # is_valid_url runs on every anchor of every page; parse the base
+        # netloc once instead of per link
+        self._base_netloc = urlparse(base_url).netloc
+        self._bad_exts = ('.jpg', '.png', '.gif', '.zip', '.doc', '.docx', '.mp4', '.mp3')
     
     def scrape_page(self, url):
         if url in self.visited_urls:
@@ -108,30 +202,40 @@ class UniversityScraper:
         print(f"[{self.university_name}] Scraping: {url}")
         
         try:
-            response = requests.get(url, headers=self.headers, timeout=15)
+            self.rate_limiter.acquire(urlparse(url).netloc)
+            response = self.session.get(url, timeout=15)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
+            # selectolax parses in C (lexbor); html.parser via BeautifulSoup
+            # was the slowest pure-Python option and dominated per-page CPU
+            tree = HTMLParser(response.content)
+
             # Remove unwanted elements
-            for element in soup(['script', 'style', 'nav', 'footer', 'header', 'aside']):
+            for element in tree.css('script, style, nav, footer, header, aside'):
                 element.decompose()
-            
+
             # Extract metadata
-            title = soup.title.string if soup.title else 'No Title'
-            
+            title_node = tree.css_first('title')
+            title = title_node.text() if title_node else 'No Title'
+
             # Extract main content
-            main_content = soup.find('main') or soup.find('article') or soup.find('body')
-            text_content = main_content.get_text(separator='\n', strip=True) if main_content else ''
+            main_content = tree.css_first('main') or tree.css_first('article') or tree.css_first('body')
+            text_content = main_content.text(separator='\n', strip=True) if main_content else ''
             
-            # CLEAN TEXT IN REAL-TIME
+            # CLEAN TEXT IN REAL-TIME (split once; every word-count check
+            # and the chunker reuse the same list)
             text_cleaned = self.cleaner.clean(text_content)
-            
+            words = text_cleaned.split()
+
             # Skip if too short after cleaning
-            if len(text_cleaned.split()) < 50:
+            if len(words) < 50:
                 print(f"[{self.university_name}]    ⚠️  Skipped (too short after cleaning)")
                 return None
-            
+
+            # One timestamp per page; datetime.now().isoformat() per chunk
+            # added up across tens of thousands of chunks
+            now_iso = datetime.now().isoformat()
+
             # Store raw document
             doc = {
                 'url': url,
@@ -139,45 +243,55 @@ class UniversityScraper:
                 'title': title,
                 'content': text_cleaned,  # Already cleaned!
                 'type': 'webpage',
-                'scraped_at': datetime.now().isoformat(),
-                'word_count': len(text_cleaned.split())
+                'scraped_at': now_iso,
+                'word_count': len(words)
             }
-            
+
             with self.lock:
                 self.documents.append(doc)
-            
-            # CREATE CHUNKS IN REAL-TIME
-            chunks = self.cleaner.chunk_text(text_cleaned)
-            for idx, chunk_text in enumerate(chunks):
-                chunk_doc = {
-                    'chunk_id': f"{self.university_name}_{len(self.chunks)}",
+
+            # CREATE CHUNKS IN REAL-TIME — shared fields built once per page,
+            # each chunk only adds its index and word count
+            base_meta = {
+                'university': self.university_name,
+                'source_url': url,
+                'title': title,
+                'type': 'webpage',
+                'scraped_at': now_iso,
+            }
+            chunks = self.cleaner.chunk_words(words)
+            new_chunks = [
+                {
+                    'chunk_id': None,  # assigned under the lock below
                     'text': chunk_text,
                     'metadata': {
-                        'university': self.university_name,
-                        'source_url': url,
-                        'title': title,
-                        'type': 'webpage',
+                        **base_meta,
                         'chunk_index': idx,
-                        'word_count': len(chunk_text.split()),
-                        'scraped_at': datetime.now().isoformat()
+                        'word_count': wc,
                     }
                 }
-                with self.lock:
-                    self.chunks.append(chunk_doc)
+                for idx, (chunk_text, wc) in enumerate(chunks)
+            ]
+            # One lock acquisition per page, not one per chunk; chunk ids
+            # come from the list positions claimed under the lock
+            with self.lock:
+                start = len(self.chunks)
+                for offset, chunk_doc in enumerate(new_chunks):
+                    chunk_doc['chunk_id'] = f"{self.university_name}_{start + offset}"
+                self.chunks.extend(new_chunks)
             
-            # Find all links on the page
+            # Classify links in one pass: PDFs go straight to the PDF pool,
+            # everything else feeds the crawl frontier
             links = []
-            for link in soup.find_all('a', href=True):
-                absolute_url = urljoin(url, link['href'])
-                if self.is_valid_url(absolute_url):
+            for link in tree.css('a[href]'):
+                absolute_url = urljoin(url, link.attributes.get('href') or '')
+                if not self.is_valid_url(absolute_url):
+                    continue
+                if absolute_url.lower().endswith('.pdf'):
+                    self.pdf_pool.submit(self.download_and_extract_pdf, absolute_url)
+                else:
                     links.append(absolute_url)
             
-            # Find PDF links
-            pdf_links = [link for link in links if link.lower().endswith('.pdf')]
-            for pdf_url in pdf_links:
-                self.download_and_extract_pdf(pdf_url)
-            
-            time.sleep(1)
             return links
             
         except Exception as e:
@@ -194,31 +308,30 @@ class UniversityScraper:
         print(f"[{self.university_name}] Downloading PDF: {pdf_url}")
         
         try:
-            # Check file size
-            head_response = requests.head(pdf_url, headers=self.headers, timeout=10, allow_redirects=True)
-            
-            if head_response.status_code == 404:
-                print(f"[{self.university_name}] ⚠️  PDF not found (404)")
-                return
-            
-            file_size = int(head_response.headers.get('content-length', 0))
+            self.rate_limiter.acquire(urlparse(pdf_url).netloc)
+            # Single streaming GET: the headers arrive before the body, so the
+            # size check reads Content-Length off the GET itself instead of a
+            # separate HEAD round-trip (which some servers 405 anyway).
+            response = self.session.get(pdf_url, timeout=60, stream=True)
+            response.raise_for_status()
+
+            file_size = int(response.headers.get('content-length', 0))
             file_size_mb = file_size / (1024 * 1024)
-            
+
             # Skip very large files
             if file_size > 5 * 1024 * 1024:
                 print(f"[{self.university_name}] ⚠️  Skipping large PDF ({file_size_mb:.1f}MB)")
+                response.close()
                 return
-            
+
             print(f"[{self.university_name}]    Size: {file_size_mb:.1f}MB - Downloading...")
-            
-            # Download
-            response = requests.get(pdf_url, headers=self.headers, timeout=60, stream=True)
-            response.raise_for_status()
-            
-            pdf_content = b''
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    pdf_content += chunk
+
+            # Read the body in one urllib3 call; iter_content bounces every
+            # chunk through a Python generator, which is pure interpreter
+            # overhead once the 5 MB guard above has bounded the size.
+            # decode_content handles gzip/deflate transfer encoding.
+            response.raw.decode_content = True
+            pdf_content = response.raw.read()
             
             # Save PDF
             pdf_filename = os.path.basename(urlparse(pdf_url).path)
@@ -231,27 +344,38 @@ class UniversityScraper:
             
             print(f"[{self.university_name}]    Extracting text...")
             
-            # Extract text
-            pdf_reader = PyPDF2.PdfReader(io.BytesIO(pdf_content))
-            num_pages = len(pdf_reader.pages)
+            # Extract text (pdfium is C++; PyPDF2's pure-Python
+            # extract_text was the CPU bottleneck on long PDFs)
+            pdf = pdfium.PdfDocument(pdf_content)
+            num_pages = len(pdf)
             max_pages = min(num_pages, 200)
-            
-            text_content = ''
+
+            # Collect pages and join once; += on a growing string re-copies
+            # everything extracted so far for each page
+            pages_text = []
             for page_num in range(max_pages):
                 try:
-                    page = pdf_reader.pages[page_num]
-                    text_content += page.extract_text() + '\n\n'
+                    page = pdf[page_num]
+                    textpage = page.get_textpage()
+                    pages_text.append(textpage.get_text_range())
+                    textpage.close()
+                    page.close()
                 except:
                     continue
+            pdf.close()
+            text_content = '\n\n'.join(pages_text)
             
-            # CLEAN TEXT IN REAL-TIME
+            # CLEAN TEXT IN REAL-TIME (split once and reuse)
             text_cleaned = self.cleaner.clean(text_content)
-            
+            words = text_cleaned.split()
+
             # Skip if too short
-            if len(text_cleaned.split()) < 50:
+            if len(words) < 50:
                 print(f"[{self.university_name}] Skipped (too short after cleaning)")
                 return
-            
+
+            now_iso = datetime.now().isoformat()
+
             # Store document
             doc = {
                 'url': pdf_url,
@@ -259,36 +383,43 @@ class UniversityScraper:
                 'title': pdf_filename,
                 'content': text_cleaned,
                 'type': 'pdf',
-                'scraped_at': datetime.now().isoformat(),
-                'word_count': len(text_cleaned.split()),
+                'scraped_at': now_iso,
+                'word_count': len(words),
                 'page_count': num_pages,
                 'file_size_mb': round(file_size_mb, 2)
             }
-            
+
             with self.lock:
                 self.documents.append(doc)
-            
-            # CREATE CHUNKS IN REAL-TIME
-            chunks = self.cleaner.chunk_text(text_cleaned)
-            for idx, chunk_text in enumerate(chunks):
-                chunk_doc = {
-                    'chunk_id': f"{self.university_name}_{len(self.chunks)}",
+
+            # CREATE CHUNKS IN REAL-TIME — shared fields built once per PDF
+            base_meta = {
+                'university': self.university_name,
+                'source_url': pdf_url,
+                'title': pdf_filename,
+                'type': 'pdf',
+                'scraped_at': now_iso,
+            }
+            chunks = self.cleaner.chunk_words(words)
+            new_chunks = [
+                {
+                    'chunk_id': None,  # assigned under the lock below
                     'text': chunk_text,
                     'metadata': {
-                        'university': self.university_name,
-                        'source_url': pdf_url,
-                        'title': pdf_filename,
-                        'type': 'pdf',
+                        **base_meta,
                         'chunk_index': idx,
-                        'word_count': len(chunk_text.split()),
-                        'scraped_at': datetime.now().isoformat()
+                        'word_count': wc,
                     }
                 }
-                with self.lock:
-                    self.chunks.append(chunk_doc)
+                for idx, (chunk_text, wc) in enumerate(chunks)
+            ]
+            with self.lock:
+                start = len(self.chunks)
+                for offset, chunk_doc in enumerate(new_chunks):
+                    chunk_doc['chunk_id'] = f"{self.university_name}_{start + offset}"
+                self.chunks.extend(new_chunks)
             
-            print(f"[{self.university_name}]    Completed: {len(text_cleaned.split())} words, {len(chunks)} chunks")
-            time.sleep(1)
+            print(f"[{self.university_name}]    Completed: {len(words)} words, {len(chunks)} chunks")
             
         except requests.exceptions.Timeout:
             print(f"[{self.university_name}] Timeout")
@@ -296,45 +427,75 @@ class UniversityScraper:
             print(f"[{self.university_name}] Error: {str(e)[:50]}")
     
     def is_valid_url(self, url):
-        parsed = urlparse(url)
-        base_parsed = urlparse(self.base_url)
-        return (parsed.netloc == base_parsed.netloc and 
-                not url.endswith(('.jpg', '.png', '.gif', '.zip', '.doc', '.docx', '.mp4', '.mp3')))
+        return (urlparse(url).netloc == self._base_netloc and
+                not url.endswith(self._bad_exts))
     
-    def crawl_site(self, start_urls, max_pages=100):
-        """Crawl pages"""
+    def crawl_site(self, start_urls, max_pages=100, max_workers=16):
+        """Crawl pages, fetching up to max_workers URLs concurrently"""
         self.max_pages = max_pages
-        to_visit = list(start_urls)
+        to_visit = deque(start_urls)
+        # Companion set for O(1) "already queued?" checks; the visited_urls
+        # filter below misses URLs that are enqueued but not yet fetched, and
+        # link-heavy pages re-enqueue the same URLs hundreds of times.
+        queued = set(start_urls)
         pages_scraped = 0
         
-        while to_visit and pages_scraped < max_pages:
-            url = to_visit.pop(0)
-            
-            if url not in self.visited_urls:
-                links = self.scrape_page(url)
-                pages_scraped += 1
+        # Fetching is I/O-bound, so keep a window of max_workers pages in
+        # flight; as each finishes, its links refill the frontier and the
+        # window tops back up. scrape_page dedups against visited_urls under
+        # self.lock, so a URL racing into the window twice is scraped once.
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            in_flight = {}
+            while (to_visit or in_flight) and pages_scraped < max_pages:
+                while (to_visit and len(in_flight) < max_workers
+                       and pages_scraped + len(in_flight) < max_pages):
+                    url = to_visit.popleft()
+                    if url not in self.visited_urls:
+                        in_flight[executor.submit(self.scrape_page, url)] = url
                 
-                if links:
-                    new_links = [l for l in links if l not in self.visited_urls]
-                    to_visit.extend(new_links[:50])
+                if not in_flight:
+                    break
                 
-                if pages_scraped % 10 == 0:
-                    print(f"[{self.university_name}] Progress: {pages_scraped}/{max_pages} pages | {len(self.documents)} docs | {len(self.chunks)} chunks")
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight.pop(future)
+                    links = future.result()
+                    pages_scraped += 1
+                    
+                    if links:
+                        added = 0
+                        for link in links:
+                            if link not in self.visited_urls and link not in queued:
+                                queued.add(link)
+                                to_visit.append(link)
+                                added += 1
+                                if added >= 50:
+                                    break
+                    
+                    if pages_scraped % 10 == 0:
+                        print(f"[{self.university_name}] Progress: {pages_scraped}/{max_pages} pages | {len(self.documents)} docs | {len(self.chunks)} chunks")
         
         print(f"[{self.university_name}] Complete! {len(self.documents)} docs | {len(self.chunks)} chunks")
     
     def save_documents(self):
         """Save both raw documents and embedding-ready chunks"""
         
-        # Save raw documents
+        # Wait for in-flight PDF work so its documents/chunks are included
+        self.pdf_pool.shutdown(wait=True)
+        
+        # Save raw documents (orjson serializes in native code and writes
+        # UTF-8 bytes directly; the stdlib encoder was the slow tail of a
+        # crawl once document counts reached the thousands). These files are
+        # machine-consumed by the embedding pipeline, so no indentation —
+        # pretty-printing roughly doubled their size.
         raw_file = f"{self.output_dir}/processed/{self.university_name}_documents.json"
-        with open(raw_file, 'w', encoding='utf-8') as f:
-            json.dump(self.documents, f, indent=2, ensure_ascii=False)
+        with open(raw_file, 'wb') as f:
+            f.write(orjson.dumps(self.documents))
         
         # Save embedding-ready chunks
         chunks_file = f"{self.output_dir}/embeddings_ready/{self.university_name}_chunks.json"
-        with open(chunks_file, 'w', encoding='utf-8') as f:
-            json.dump(self.chunks, f, indent=2, ensure_ascii=False)
+        with open(chunks_file, 'wb') as f:
+            f.write(orjson.dumps(self.chunks))
         
         print(f"[{self.university_name}] Saved:")
         print(f"[{self.university_name}] Raw: {raw_file}")
@@ -353,8 +514,8 @@ class UniversityScraper:
         }
         
         stats_file = f"{self.output_dir}/processed/{self.university_name}_stats.json"
-        with open(stats_file, 'w') as f:
-            json.dump(stats, f, indent=2)
+        with open(stats_file, 'wb') as f:
+            f.write(orjson.dumps(stats, option=orjson.OPT_INDENT_2))
         
         return raw_file, chunks_file
 
@@ -668,8 +829,31 @@ UT_SYSTEM_SCHOOLS = [
 ]
 
 
-def scrape_single_school(school_config):
-    """Scrape one school with real-time cleaning"""
+def scrape_single_school(school_config, reuse_hours=24):
+    """Scrape one school with real-time cleaning.
+
+    If this school's output files already exist and are younger than
+    reuse_hours, they are loaded back instead of rescraped — a crashed or
+    interrupted run resumes from the schools that finished rather than
+    repaying the whole crawl. Pass reuse_hours=0 to force a fresh scrape.
+    """
+    name = school_config['name']
+    raw_file = f"scraped_data/processed/{name}_documents.json"
+    chunks_file = f"scraped_data/embeddings_ready/{name}_chunks.json"
+
+    if reuse_hours > 0 and os.path.exists(raw_file) and os.path.exists(chunks_file):
+        age_hours = (time.time() - os.path.getmtime(chunks_file)) / 3600
+        if age_hours < reuse_hours:
+            documents = orjson.loads(open(raw_file, 'rb').read())
+            chunks = orjson.loads(open(chunks_file, 'rb').read())
+            print(f"\nREUSING: {name} ({age_hours:.1f}h old, {len(chunks)} chunks)")
+            return {
+                'name': name,
+                'documents': len(documents),
+                'chunks': len(chunks),
+                'status': 'cached'
+            }, documents, chunks
+
     try:
         print(f"\n{'='*80}")
         print(f"STARTING: {school_config['name']}")
@@ -704,23 +888,48 @@ def scrape_single_school(school_config):
         }, [], []
 
 
-def scrape_all_ut_schools_parallel(max_workers=4):
-    """Scrape all schools in parallel with real-time cleaning"""
-    
+def scrape_all_ut_schools_parallel(max_workers=4, strategy="thread", reuse_hours=24):
+    """Scrape all schools in parallel with real-time cleaning.
+
+    strategy picks the school-level executor: "thread" (default) suits the
+    usual profile where workers sit blocked on sockets; "process" sidesteps
+    the GIL if profiling ever shows HTML/PDF parsing dominating.
+    scrape_single_school takes a plain config dict and returns plain dicts,
+    so it is pickle-safe for the process pool as-is.
+    """
+    if strategy == "process":
+        executor_cls = ProcessPoolExecutor
+    elif strategy == "thread":
+        executor_cls = ThreadPoolExecutor
+    else:
+        raise ValueError(f"Unknown strategy: {strategy!r} (use 'thread' or 'process')")
+
     print("="*80)
     print("UT SYSTEM PARALLEL SCRAPER WITH REAL-TIME CLEANING")
-    print(f"Parallel Workers: {max_workers}")
+    print(f"Parallel Workers: {max_workers} ({strategy})")
     print("="*80)
     print(f"\nStarting scrape of {len(UT_SYSTEM_SCHOOLS)} UT institutions\n")
     
     start_time = time.time()
-    all_documents = []
-    all_chunks = []
     results_summary = []
+    total_documents = 0
+    total_chunks = 0
+    total_words = 0
+    total_chunk_words = 0
+    
+    # Stream each school's results to newline-delimited JSON as it finishes.
+    # Accumulating every school's documents/chunks and encoding them in one
+    # shot made peak memory the whole corpus plus its serialized copy; the
+    # NDJSON sink bounds it to one school's lists, and partial progress
+    # survives a crash.
+    combined_raw = 'scraped_data/processed/all_ut_schools_combined.ndjson'
+    combined_chunks = 'scraped_data/embeddings_ready/all_ut_schools_chunks.ndjson'
     
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+    with executor_cls(max_workers=max_workers) as executor, \
+            open(combined_raw, 'wb') as raw_f, \
+            open(combined_chunks, 'wb') as chunks_f:
         future_to_school = {
-            executor.submit(scrape_single_school, school): school
+            executor.submit(scrape_single_school, school, reuse_hours): school
             for school in UT_SYSTEM_SCHOOLS
         }
         
@@ -728,31 +937,29 @@ def scrape_all_ut_schools_parallel(max_workers=4):
             try:
                 result, documents, chunks = future.result()
                 results_summary.append(result)
-                all_documents.extend(documents)
-                all_chunks.extend(chunks)
+                
+                for doc in documents:
+                    raw_f.write(orjson.dumps(doc))
+                    raw_f.write(b"\n")
+                    total_words += doc.get('word_count', 0)
+                for chunk in chunks:
+                    chunks_f.write(orjson.dumps(chunk))
+                    chunks_f.write(b"\n")
+                    total_chunk_words += chunk['metadata']['word_count']
+                total_documents += len(documents)
+                total_chunks += len(chunks)
                 
                 completed = len(results_summary)
                 print(f"\nPROGRESS: {completed}/{len(UT_SYSTEM_SCHOOLS)} schools")
-                print(f"   Total chunks (ready for embeddings): {len(all_chunks):,}")
+                print(f"   Total chunks (ready for embeddings): {total_chunks:,}")
                 
             except Exception as e:
                 print(f"\nException: {e}")
     
-    # Save combined files
     print("\n" + "="*80)
     print("SAVING COMBINED DATASETS")
     print("="*80)
-    
-    # Combined raw documents
-    combined_raw = 'scraped_data/processed/all_ut_schools_combined.json'
-    with open(combined_raw, 'w', encoding='utf-8') as f:
-        json.dump(all_documents, f, indent=2, ensure_ascii=False)
     print(f"Raw documents: {combined_raw}")
-    
-    # Combined embedding-ready chunks
-    combined_chunks = 'scraped_data/embeddings_ready/all_ut_schools_chunks.json'
-    with open(combined_chunks, 'w', encoding='utf-8') as f:
-        json.dump(all_chunks, f, indent=2, ensure_ascii=False)
     print(f"Embedding chunks: {combined_chunks}")
     
     # Summary
@@ -760,18 +967,18 @@ def scrape_all_ut_schools_parallel(max_workers=4):
     summary = {
         'scraped_at': datetime.now().isoformat(),
         'total_schools': len(UT_SYSTEM_SCHOOLS),
-        'successful': sum(1 for r in results_summary if r['status'] == 'success'),
-        'total_documents': len(all_documents),
-        'total_chunks': len(all_chunks),
-        'total_words': sum(doc.get('word_count', 0) for doc in all_documents),
-        'avg_chunk_size': sum(c['metadata']['word_count'] for c in all_chunks) / len(all_chunks) if all_chunks else 0,
+        'successful': sum(1 for r in results_summary if r['status'] in ('success', 'cached')),
+        'total_documents': total_documents,
+        'total_chunks': total_chunks,
+        'total_words': total_words,
+        'avg_chunk_size': total_chunk_words / total_chunks if total_chunks else 0,
         'time_minutes': round(total_time / 60, 2),
         'schools': results_summary
     }
     
     summary_file = 'scraped_data/processed/scraping_summary.json'
-    with open(summary_file, 'w') as f:
-        json.dump(summary, f, indent=2)
+    with open(summary_file, 'wb') as f:
+        f.write(orjson.dumps(summary, option=orjson.OPT_INDENT_2))
     
     print(f"\n{'='*80}")
     print("SCRAPING COMPLETE!")
@@ -782,11 +989,37 @@ def scrape_all_ut_schools_parallel(max_workers=4):
     print(f"Avg chunk size: {summary['avg_chunk_size']:.0f} words")
     print(f"Time: {total_time/60:.1f} minutes")
     print(f"\nYour data is in:")
-    print(f"   scraped_data/embeddings_ready/all_ut_schools_chunks.json")
+    print(f"   scraped_data/embeddings_ready/all_ut_schools_chunks.ndjson")
     print(f"\nNext: Generate embeddings from the chunks file!")
     
     return summary
 
 
 if __name__ == "__main__":
-    summary = scrape_all_ut_schools_parallel(max_workers=4)
\ No newline at end of file
+    # Schools spend nearly all their time blocked on sockets, so the worker
+    # count is an I/O-concurrency knob, not a CPU one; 4-16 is a sensible
+    # range depending on how many schools are enabled above.
+    parser = argparse.ArgumentParser(description="Scrape UT System school sites")
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=int(os.environ.get("UT_SCRAPE_WORKERS", "8")),
+        help="Parallel school scrapers (default: UT_SCRAPE_WORKERS or 8)",
+    )
+    parser.add_argument(
+        '--strategy',
+        choices=('thread', 'process'),
+        default=os.environ.get("UT_SCRAPE_STRATEGY", "thread"),
+        help="School-level executor (default: UT_SCRAPE_STRATEGY or thread)",
+    )
+    parser.add_argument(
+        '--reuse-hours',
+        type=float,
+        default=float(os.environ.get("UT_SCRAPE_REUSE_HOURS", "24")),
+        help="Reuse per-school output younger than this many hours; 0 rescrapes everything "
+             "(default: UT_SCRAPE_REUSE_HOURS or 24)",
+    )
+    args = parser.parse_args()
+    summary = scrape_all_ut_schools_parallel(
+        max_workers=args.workers, strategy=args.strategy, reuse_hours=args.reuse_hours
+    )
\ No newline at end of file
@@ -7,6 +7,11 @@ load_dotenv()
 
 TABLE_NAME = "langgraph-checkpoints"
 
+# Shared clients: each boto3.client/resource() call re-parses service JSON
+# and rebuilds endpoints (tens of ms), so construct once at module scope.
+DDB_CLIENT = boto3.client("dynamodb")
+DDB_RESOURCE = boto3.resource("dynamodb")
+
 # session = boto3.Session()
 # print("Using AWS region from boto3 session:", session.region_name)
 
@@ -23,19 +28,17 @@ def test_aws_credentials():
 
 def test_table_exists():
     """Check if DynamoDB table exists."""
-    dynamodb = boto3.client("dynamodb")
     try:
-        response = dynamodb.describe_table(TableName=TABLE_NAME)
+        response = DDB_CLIENT.describe_table(TableName=TABLE_NAME)
         print("DynamoDB table exists:", response["Table"]["TableName"])
-    except dynamodb.exceptions.ResourceNotFoundException:
+    except DDB_CLIENT.exceptions.ResourceNotFoundException:
         print(f"Table `{TABLE_NAME}` does NOT exist.")
         return
 
 
 def test_table_key_schema():
     """Check table has correct partition/sort keys."""
-    dynamodb = boto3.client("dynamodb")
-    response = dynamodb.describe_table(TableName=TABLE_NAME)
+    response = DDB_CLIENT.describe_table(TableName=TABLE_NAME)
     key_schema = response["Table"]["KeySchema"]
 
     expected = [
@@ -52,48 +55,57 @@ def test_table_key_schema():
 
 
 def test_put_and_get_item():
-    """Write and read an item from DynamoDB to validate R/W permissions."""
-    dynamodb = boto3.resource("dynamodb")
-    table = dynamodb.Table(TABLE_NAME)
+    """Write and read an item from DynamoDB to validate R/W permissions.
+
+    Writes go through batch_writer and the read through BatchGetItem, so
+    the same exercise also validates the batched call shapes the
+    checkpointer should use when coalescing per-turn writes.
+    """
+    table = DDB_RESOURCE.Table(TABLE_NAME)
 
     test_thread = "test-thread"
     test_checkpoint = str(uuid.uuid4())
     test_data = {"hello": "world"}
+    test_key = {
+        "thread_id": test_thread,
+        "checkpoint_id": test_checkpoint,
+    }
 
-    # PUT
+    # PUT (batched; one BatchWriteItem request on context exit)
     try:
-        table.put_item(
-            Item={
-                "thread_id": test_thread,
-                "checkpoint_id": test_checkpoint,
-                "data": test_data,
-            }
-        )
-        print("PutItem succeeded.")
+        with table.batch_writer() as bw:
+            bw.put_item(
+                Item={
+                    "thread_id": test_thread,
+                    "checkpoint_id": test_checkpoint,
+                    "data": test_data,
+                }
+            )
+        print("Batched PutItem succeeded.")
     except ClientError as e:
-        print("PutItem failed:", e)
+        print("Batched PutItem failed:", e)
         return
 
-    # GET
+    # GET (BatchGetItem; serializer needed since this is the low-level client)
     try:
-        result = table.get_item(
-            Key={
-                "thread_id": test_thread,
-                "checkpoint_id": test_checkpoint,
+        from boto3.dynamodb.types import TypeSerializer
+
+        serializer = TypeSerializer()
+        result = DDB_CLIENT.batch_get_item(
+            RequestItems={
+                TABLE_NAME: {
+                    "Keys": [{k: serializer.serialize(v) for k, v in test_key.items()}]
+                }
             }
         )
-        print("GetItem returned:", result.get("Item"))
+        print("BatchGetItem returned:", result.get("Responses", {}).get(TABLE_NAME))
     except ClientError as e:
-        print("GetItem failed:", e)
+        print("BatchGetItem failed:", e)
 
-    # CLEANUP (optional)
+    # CLEANUP (optional; rides the same batched write path)
     try:
-        table.delete_item(
-            Key={
-                "thread_id": test_thread,
-                "checkpoint_id": test_checkpoint,
-            }
-        )
+        with table.batch_writer() as bw:
+            bw.delete_item(Key=test_key)
         print("Cleanup succeeded.")
     except Exception:
         print("Cleanup failed (safe to ignore).")
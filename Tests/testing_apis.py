@@ -6,6 +6,7 @@ table = dynamodb.Table('langgraph-user-personal-history')
 
 # Test 1: Create a new user
 print("Test 1: Creating new user...")
+now = datetime.utcnow().isoformat()
 table.put_item(
     Item={
         'user_id': 'test@example.com',
@@ -13,12 +14,12 @@ table.put_item(
             {
                 'thread_id': 'thread-001',
                 'title': 'What are the fees',
-                'created_at': datetime.utcnow().isoformat(),
-                'updated_at': datetime.utcnow().isoformat()
+                'created_at': now,
+                'updated_at': now
             }
         ],
-        'created_at': datetime.utcnow().isoformat(),
-        'updated_at': datetime.utcnow().isoformat()
+        'created_at': now,
+        'updated_at': now
     }
 )
 print("User created")
@@ -29,24 +30,25 @@ response = table.get_item(Key={'user_id': 'test@example.com'})
 print(f"User data: {response.get('Item')}")
 
 # Test 3: Update user history
+# Server-side list_append: one request whose payload is just the new entry,
+# instead of get_item + rewriting the whole list (two RTTs, racy, and O(N)
+# bytes per append). Matches what the production history writer does.
 print("\nTest 3: Updating user history...")
-response = table.get_item(Key={'user_id': 'test@example.com'})
-item = response.get('Item', {})
-history = item.get('personal_history', [])
-
-history.append({
+now = datetime.utcnow().isoformat()
+new_entry = {
     'thread_id': 'thread-002',
     'title': 'Tell me about scholarships',
-    'created_at': datetime.utcnow().isoformat(),
-    'updated_at': datetime.utcnow().isoformat()
-})
+    'created_at': now,
+    'updated_at': now
+}
 
 table.update_item(
     Key={'user_id': 'test@example.com'},
-    UpdateExpression='SET personal_history = :ph, updated_at = :ua',
+    UpdateExpression='SET personal_history = list_append(if_not_exists(personal_history, :empty), :new), updated_at = :ua',
     ExpressionAttributeValues={
-        ':ph': history,
-        ':ua': datetime.utcnow().isoformat()
+        ':empty': [],
+        ':new': [new_entry],
+        ':ua': now
     }
 )
 print("History updated")
@@ -59,4 +61,4 @@ print(f"Updated data: {response.get('Item')}")
 # # Cleanup
 # print("\nCleaning up...")
 # table.delete_item(Key={'user_id': 'test@example.com'})
-# print("Test data deleted")
\ No newline at end of file
+# print("Test data deleted")
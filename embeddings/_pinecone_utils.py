@@ -0,0 +1,45 @@
+import os
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=1)
+def get_pinecone_client():
+    """
+    Process-wide Pinecone client, built lazily on first use.
+
+    The first call loads .env and validates the API key; every script that
+    needs Pinecone shares this one client instead of re-reading the env and
+    re-building its own.
+    """
+    from pinecone import Pinecone
+
+    load_dotenv()
+    api_key = os.getenv("PINECONE_API_KEY")
+    if not api_key:
+        raise RuntimeError("PINECONE_API_KEY is not set in environment")
+    return Pinecone(api_key=api_key)
+
+
+@lru_cache(maxsize=1)
+def get_gemini_embeddings():
+    """Process-wide Gemini embeddings model, built lazily on first use."""
+    from langchain_google_genai import GoogleGenerativeAIEmbeddings
+
+    load_dotenv()
+    if not os.getenv("GOOGLE_API_KEY"):
+        raise RuntimeError("GOOGLE_API_KEY is not set in environment")
+    return GoogleGenerativeAIEmbeddings(model="models/gemini-embedding-001")
+
+
+@lru_cache(maxsize=None)
+def get_index_names(client):
+    """
+    Return the names of a client's Pinecone indexes, memoized per client.
+
+    list_indexes() is an HTTPS round trip; scripts that check for an index
+    more than once in a process (or import each other) should share one
+    listing instead of re-fetching it.
+    """
+    return tuple(client.list_indexes().names())
@@ -1,14 +1,19 @@
 
-from dotenv import load_dotenv
-import os
-from pinecone import Pinecone as pc
+from concurrent.futures import ThreadPoolExecutor
 
-load_dotenv()
-pc_client = pc(api_key=os.getenv("PINECONE_API_KEY"))
-indexes = pc_client.list_indexes()
-print(indexes)
+from _pinecone_utils import get_index_names, get_pinecone_client
 
-for index in indexes.names():
-    print(f'Index found: {index}')
-    # print(index.describe_index_stats())
+pc_client = get_pinecone_client()
+names = get_index_names(pc_client)
+
+# Each describe_index_stats is its own round trip; fetch them in parallel so
+# the wall time is one RTT regardless of how many indexes exist.
+with ThreadPoolExecutor(max_workers=8) as ex:
+    stats = dict(zip(
+        names,
+        ex.map(lambda n: pc_client.Index(n).describe_index_stats(), names),
+    ))
 
+for index in names:
+    print(f'Index found: {index}')
+    print(stats[index])
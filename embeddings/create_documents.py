@@ -1,24 +1,39 @@
-import json
 import glob
+import json
+import ijson
 import langchain_core.documents as Documents
 
 def load_chunks_to_documents(pattern: str="../scraped_data/embeddings_ready/*_chunks.json"):
+    """
+    Yield Documents one chunk at a time.
 
-    docs = []
+    JSON-array files stream through ijson and NDJSON files decode line by
+    line, so peak memory is one chunk dict plus the Document being built
+    instead of every chunk in the corpus — json.load materialized the whole
+    array before the first Document existed.
+    """
+    total = 0
 
-    for path in glob.glob(pattern):
+    # Sorted so the document order is stable across runs and filesystems.
+    for path in sorted(glob.glob(pattern)):
         print(f'Loading chunks from: {path}')
-        with open(path, 'r', encoding='utf-8') as f:
-            file_chunks = json.load(f)
+        with open(path, 'rb') as f:
+            if path.endswith('.ndjson'):
+                chunk_iter = (json.loads(line) for line in f if line.strip())
+            else:
+                chunk_iter = ijson.items(f, 'item')
+
+            for chunk in chunk_iter:
+                # Mutate the parsed dict directly: nothing else holds the
+                # chunk once it leaves the stream, so a defensive copy is
+                # one dict allocation per chunk for no benefit.
+                metadata = chunk.get('metadata') or {}
+                metadata['chunk_id'] = chunk.get('chunk_id')
+                total += 1
 
-        for chunk in file_chunks:
-            metadata = chunk.get('metadata', {}).copy()
-            metadata['chunk_id'] = chunk.get('chunk_id')
+                yield Documents.Document(
+                    page_content=chunk.get('text'),
+                    metadata=metadata
+                )
 
-            doc = Documents.Document(
-                page_content=chunk.get('text'),
-                metadata=metadata
-            )
-            docs.append(doc)
-    print(f'Total documents loaded: {len(docs)}')
-    return docs
\ No newline at end of file
+    print(f'Total documents loaded: {total}')
@@ -1,35 +1,26 @@
+import hashlib
 import os
+import random
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
+from itertools import islice
 from langchain_core.documents import Document
-from dotenv import load_dotenv
 from langchain_pinecone import PineconeVectorStore
-from pinecone import Pinecone as pc, ServerlessSpec
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langchain_google_genai._common import GoogleGenerativeAIError
+from _pinecone_utils import get_gemini_embeddings, get_index_names, get_pinecone_client
 from create_documents import load_chunks_to_documents
 import time
 
 
-load_dotenv()
-os.environ["GOOGLE_API_KEY"] = os.getenv("GOOGLE_API_KEY")
-os.environ["PINECONE_API_KEY"] = os.getenv("PINECONE_API_KEY")
+# Shared lazy singletons: first call loads .env and raises if a key is unset.
+pine_client = get_pinecone_client()
+gemini_embeddings = get_gemini_embeddings()
 index_name = os.getenv("PINECONE_INDEX_NAME", "ut-multi-campus-v1")
 
 
-
-# Eoor Raise if there are no API KEYS set   
-if not os.environ.get("PINECONE_API_KEY"):
-    raise RuntimeError("PINECONE_API_KEY is not set in environment")
-
-if not os.environ.get("GOOGLE_API_KEY"):
-    raise RuntimeError("GOOGLE_API_KEY is not set in environment")
-
-# embeddings model
-gemini_embeddings = GoogleGenerativeAIEmbeddings(model="models/gemini-embedding-001")
-pine_client = pc(api_key=os.environ["PINECONE_API_KEY"])
-
-
 # sanity check that index exists
-if index_name not in pine_client.list_indexes().names():
+if index_name not in get_index_names(pine_client):
     raise RuntimeError(
         f"Index '{index_name}' does not exist. "
         "Run create_index.py first to create it."
@@ -37,22 +28,12 @@ if index_name not in pine_client.list_indexes().names():
 
 index = pine_client.Index(index_name)
 stats = index.describe_index_stats()
-already_vectors = stats.get("total_vector_count", 0)
+print(f"Index currently holds {stats.get('total_vector_count', 0)} vectors")
 
 print("Loading UT chunks into Documents...")
-docs = load_chunks_to_documents(
+docs_iter = load_chunks_to_documents(
     pattern="../scraped_data/embeddings_ready/*_chunks.json"
 )
-print(f"Total Documents to embed: {len(docs)}")
-
-start_offset = already_vectors
-if start_offset >= len(docs):
-    print("All docs appear to be embedded already.")
-    raise SystemExit
-
-# sanity check that we have documents
-if not docs:
-    raise RuntimeError("No documents loaded. Check your chunks path and files.")
 
 vectorstore = PineconeVectorStore(
     index_name=index_name,
@@ -64,52 +45,144 @@ MAX_DOCS_PER_WINDOW = 500        # 3 batches * 100 docs
 WINDOW_SECONDS = 60              # 1 minute
 MAX_RETRIES_PER_BATCH = 5     # retry on 429 a few times
 
+# Batches are independent network calls (Gemini embed + Pinecone upsert), so
+# overlap a few of them; the quota window below still bounds total docs/min.
+EMBED_PARALLELISM = int(os.getenv("EMBED_PARALLELISM", "4"))
+
+
+def batches(doc_iter, size):
+    """Yield lists of up to `size` Documents from an iterator."""
+    it = iter(doc_iter)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+window_lock = threading.Lock()
 window_start = time.time()
 docs_in_window = 0
 
-for i in range(start_offset, len(docs), BATCH_SIZE):
-    # Throttle: if we've hit the per-minute doc limit, wait for the window to reset
-    if docs_in_window >= MAX_DOCS_PER_WINDOW:
-        elapsed = time.time() - window_start
-        if elapsed < WINDOW_SECONDS:
-            sleep_for = WINDOW_SECONDS - elapsed
-            print(f"\nReached {MAX_DOCS_PER_WINDOW} docs in this minute. "
-                  f"Sleeping {sleep_for:.1f}s to reset window...")
-            time.sleep(sleep_for)
-        # reset window
-        window_start = time.time()
-        docs_in_window = 0
 
-    batch = docs[i:i + BATCH_SIZE]
-    print(f"\nUpserting batch {i}–{i + len(batch) - 1} (size={len(batch)})...")
+def claim_quota(n):
+    """Block until `n` docs fit in the current per-minute window."""
+    global window_start, docs_in_window
+    while True:
+        with window_lock:
+            elapsed = time.time() - window_start
+            if elapsed >= WINDOW_SECONDS:
+                window_start = time.time()
+                docs_in_window = 0
+                elapsed = 0.0
+            if docs_in_window + n <= MAX_DOCS_PER_WINDOW:
+                docs_in_window += n
+                return
+            sleep_for = WINDOW_SECONDS - elapsed
+        print(f"\nReached {MAX_DOCS_PER_WINDOW} docs in this minute. "
+              f"Sleeping {sleep_for:.1f}s to reset window...")
+        time.sleep(sleep_for)
+
+
+def vector_id(doc):
+    """Deterministic Pinecone ID for a document, derived from its chunk_id.
+
+    Stable IDs make resume exact: instead of guessing how many docs a
+    previous run embedded from the index's vector count (which breaks the
+    moment file order shifts), each batch asks the index which of its IDs
+    already exist and skips those.
+    """
+    return hashlib.sha1(str(doc.metadata.get("chunk_id")).encode()).hexdigest()
+
+
+def retry_delay_hint(msg):
+    """Pull the server-suggested retry delay (seconds) out of a 429 message."""
+    match = (re.search(r"retry_delay\s*{\s*seconds:\s*(\d+)", msg)
+             or re.search(r"[Rr]etry-[Aa]fter[:\s]+(\d+)", msg))
+    return int(match.group(1)) if match else 0
+
+
+def upsert_batch(batch, start):
+    """Upsert one batch with 429 retries. Returns False when retries run out.
+
+    Docs whose vector ID is already in the index are dropped before
+    embedding, so re-runs cost one fetch per batch instead of re-paying
+    Gemini tokens and Pinecone writes for everything.
+    """
+    ids = [vector_id(doc) for doc in batch]
+    try:
+        present = set(index.fetch(ids=ids).vectors)
+    except Exception as e:
+        print(f"  fetch failed for batch starting at {start} ({e}); upserting all")
+        present = set()
+
+    if present:
+        batch = [doc for doc, vid in zip(batch, ids) if vid not in present]
+        ids = [vid for vid in ids if vid not in present]
+        if not batch:
+            print(f"Batch {start}: all {len(present)} docs already embedded, skipping")
+            return True
+        print(f"Batch {start}: skipping {len(present)} already-embedded docs")
+
+    claim_quota(len(batch))
+    print(f"\nUpserting batch {start}–{start + len(batch) - 1} (size={len(batch)})...")
 
     # Basic retry loop for 429s
     for attempt in range(1, MAX_RETRIES_PER_BATCH + 1):
         try:
-            vectorstore.add_documents(batch)
-            print(f" Batch {i}–{i + len(batch) - 1} succeeded (attempt {attempt})")
-            docs_in_window += len(batch)
-            break
+            vectorstore.add_documents(batch, ids=ids)
+            print(f" Batch {start}–{start + len(batch) - 1} succeeded (attempt {attempt})")
+            return True
         except GoogleGenerativeAIError as e:
             msg = str(e)
             if "429" in msg:
-                backoff = 30 * attempt  # 30s, 60s, 90s
-                print(f"  429 on batch starting at {i}, attempt {attempt}/{MAX_RETRIES_PER_BATCH}")
+                # Exponential backoff with jitter, never undercutting the
+                # server's own retry hint. Jitter matters with parallel
+                # workers: fixed linear sleeps had every worker retrying in
+                # lockstep against the same exhausted quota.
+                backoff = max(retry_delay_hint(msg),
+                              min(random.uniform(2, 2 * 3 ** attempt), 120))
+                print(f"  429 on batch starting at {start}, attempt {attempt}/{MAX_RETRIES_PER_BATCH}")
                 print(f"  Message: {msg}")
-                print(f"  Sleeping {backoff}s before retry...")
+                print(f"  Sleeping {backoff:.1f}s before retry...")
                 time.sleep(backoff)
                 continue
             else:
-                print(f" Non-429 error on batch starting at {i}: {msg}")
+                print(f" Non-429 error on batch starting at {start}: {msg}")
                 raise
 
-    else:
-        # All retries exhausted
-        print(f"\nGiving up on batch starting at {i} after {MAX_RETRIES_PER_BATCH} attempts.")
-        print("   Likely you hit a daily/project-level quota. "
-              "Let quota reset or increase limits, then rerun this script; "
-              "it will resume from the current vector_count.")
-        break
+    # All retries exhausted
+    print(f"\nGiving up on batch starting at {start} after {MAX_RETRIES_PER_BATCH} attempts.")
+    print("   Likely you hit a daily/project-level quota. "
+          "Let quota reset or increase limits, then rerun this script; "
+          "already-embedded docs are skipped by vector ID.")
+    return False
+
+
+i = 0
+gave_up = False
+in_flight = set()
+
+with ThreadPoolExecutor(max_workers=EMBED_PARALLELISM) as executor:
+    for batch in batches(docs_iter, BATCH_SIZE):
+        in_flight.add(executor.submit(upsert_batch, batch, i))
+        i += len(batch)
+
+        # Keep a bounded number of batches outstanding so the loader stays
+        # ahead of the network without buffering the whole corpus
+        if len(in_flight) >= EMBED_PARALLELISM * 2:
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            if not all(f.result() for f in done):
+                gave_up = True
+                break
+
+    for f in as_completed(in_flight):
+        if not f.result():
+            gave_up = True
+
+if i == 0:
+    raise RuntimeError("No documents loaded. Check your chunks path and files.")
 
-print("Finished adding all UT documents to Pinecone")
-print(f"Index name: {index_name}")
\ No newline at end of file
+if not gave_up:
+    print("Finished adding all UT documents to Pinecone")
+print(f"Index name: {index_name}")
@@ -1,17 +1,14 @@
 
-from langchain_core.documents import Document
-from pinecone import Pinecone as pc, ServerlessSpec
+from pinecone import ServerlessSpec
 import os
-from dotenv import load_dotenv
-load_dotenv()
 
-pine_client= pc(
-    api_key = os.getenv("PINECONE_API_KEY"),  # API key from app.pinecone.io
-    )
+from _pinecone_utils import get_index_names, get_pinecone_client
+
+pine_client = get_pinecone_client()
 index_name = os.getenv("PINECONE_INDEX_NAME", "ut-multi-campus-v1")
 
 # First, check if the index already exists. If it doesn't, create a new one.
-if index_name not in pine_client.list_indexes().names():
+if index_name not in get_index_names(pine_client):
     # Create a new index.
     # https://docs.pinecone.io/docs/new-api#creating-a-starter-index
     print(f'Creating index: {index_name}')